@@ -1,40 +1,98 @@
 """Command-line interface for Build-in-Public system."""
 
+import atexit
 import click
-import time
+import functools
+import threading
+import traceback
 import re
 import json
+import os
+import posixpath
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from rich.console import Console
-from rich.panel import Panel
-from rich.markdown import Markdown
-from rich.table import Table
-from rich.prompt import Confirm, IntPrompt
+from rich.text import Text
 from datetime import datetime, timedelta
+from dataclasses import dataclass
 from typing import List, Optional, Tuple
 
-from src.models import GeneratedPost, PostRecord, get_session, init_db, PostStatus
-from src.collectors.aggregator import DataAggregator
-from src.generators.post_generator import PostGenerator
-from src.generators.calendar_generator import CalendarGenerator
-from src.generators.temp_post_generator import TempPostGenerator
-from src.generators.image_generator import ImageGenerator
-from src.managers.meeting_manager import MeetingManager
-from src.publishers.xiaohongshu import XiaohongshuPublisher
-from src.publishers.twitter import TwitterPublisher
+from src.models import PostRecord, get_session, init_db, PostStatus, post_folder_name
 from src.config import settings
 from pathlib import Path
 
+__all__ = ["cli", "upload_calendar", "save_post_to_markdown"]
+
 console = Console()
 
 # Daily-auto timing (from settings - can be overridden via .env)
 # settings.daily_start_hour, settings.reschedule_hour loaded from settings
 
+# Project root directory (where .git should be)
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Timed waits for the daily-auto wait loops (never set, so wait() just blocks
+# for the timeout)
+_wait_event = threading.Event()
+
 # SFTP configuration file path
-SFTP_CONFIG_PATH = Path(__file__).parent.parent / "ftpinfo.json"
+SFTP_CONFIG_PATH = PROJECT_ROOT / "ftpinfo.json"
 
 # Calendar file path (relative to project root for git operations)
 CALENDAR_RELATIVE_PATH = "data/bip-daily-calendar.ics"
 
+# Marker holding the calendar file's mtime (ns) as of the last GitHub push
+CALENDAR_PUSH_MARKER_PATH = PROJECT_ROOT / "data" / ".calendar_last_push"
+
+# Selected-post markdown and their generated images (relative to the working
+# directory, matching where the selected posts are saved)
+SELECTED_POSTS_DIR = Path("data/selected_posts")
+POST_IMAGES_DIR = Path("data/post-images")
+
+# Launch plan mtimes/sizes as of the last reschedule that found no undone tasks
+RESCHEDULE_MANIFEST_PATH = PROJECT_ROOT / "data" / "cache" / "reschedule_manifest.json"
+
+# Image Prompts section header (English or Chinese)
+_IMAGE_PROMPTS_RE = re.compile(r'\n## (?:Image Prompts|图片生成提示)\s*\n')
+
+# GITHUB_GIST_ID line in .env
+_GIST_ID_LINE_RE = re.compile(r'^GITHUB_GIST_ID=.*$', re.MULTILINE)
+
+# Characters not allowed in generated image file names
+_IMAGE_NAME_INVALID_RE = re.compile(r'[^a-z0-9_]')
+
+# Temp post body: everything after the first --- (the metadata header ends
+# there), minus surrounding whitespace and one trailing ---
+_TEMP_POST_BODY_RE = re.compile(r'---\s*(.*?)\s*(?:---\s*)?\Z', re.DOTALL)
+
+# Post file names in a temp post folder, in lookup order
+TEMP_POST_FILENAMES = ("post.md", "post_链接内容无法获取.md")
+
+# Display flag per post language: emoji on UTF-8 terminals (or when
+# UNICODE_FLAGS is set), plain codes otherwise
+_unicode_flags = settings.unicode_flags
+if _unicode_flags is None:
+    _unicode_flags = console.encoding.lower().startswith("utf")
+_LANGUAGE_FLAGS = {"zh": "🇨🇳", "en": "🇬🇧"} if _unicode_flags else {"zh": "CN", "en": "EN"}
+
+
+def _language_flag(language: Optional[str]) -> str:
+    """Get the display flag for a post language (unknown languages show as English)."""
+    return _LANGUAGE_FLAGS.get(language, _LANGUAGE_FLAGS["en"])
+
+# `history` table columns: (header, style, justify)
+_HISTORY_COLUMNS = (
+    ("ID", "cyan", "left"),
+    ("Lang", "magenta", "left"),
+    ("Date", "green", "left"),
+    ("Style", "blue", "left"),
+    ("Words", None, "right"),
+    ("Status", "yellow", "left"),
+    ("Published", None, "left"),
+)
+
+# Above this many rows, `history` prints CSV instead of a rich table
+HISTORY_TABLE_MAX_ROWS = 500
+
 
 def _convert_windows_path_to_wsl(path: str) -> str:
     """Convert Windows path (D:/...) to WSL path (/mnt/d/...) if needed."""
@@ -49,6 +107,69 @@ def _convert_windows_path_to_wsl(path: str) -> str:
     return path
 
 
+# Cached SFTP connection (reused across uploads in long-running processes)
+_sftp_connection = None
+_sftp_lock = threading.Lock()
+
+
+def _close_sftp_connection() -> None:
+    """Close the cached SFTP connection, if any."""
+    global _sftp_connection
+    if _sftp_connection is not None:
+        try:
+            _sftp_connection.close()
+        except Exception:
+            pass
+        _sftp_connection = None
+
+
+atexit.register(_close_sftp_connection)
+
+
+def _get_sftp_connection(pysftp, ftpinfo: dict):
+    """Get a cached SFTP connection, connecting only if needed.
+
+    The SSH handshake dominates the cost of uploading a single .ics file,
+    so the connection is kept open and reused by later uploads in the same
+    process (e.g. daily-auto). Must be called with ``_sftp_lock`` held.
+
+    Args:
+        pysftp: The imported pysftp module
+        ftpinfo: SFTP settings loaded from ftpinfo.json
+
+    Returns:
+        An open pysftp.Connection
+    """
+    global _sftp_connection
+
+    if _sftp_connection is not None:
+        try:
+            if _sftp_connection.sftp_client.get_channel().get_transport().is_active():
+                return _sftp_connection
+        except Exception:
+            pass
+        _close_sftp_connection()
+
+    # Convert Windows path to WSL path if needed
+    private_key_path = _convert_windows_path_to_wsl(ftpinfo['private_key_path'])
+
+    console.print(f"  [dim]Connecting to SFTP server...[/dim]")
+
+    cnopts = pysftp.CnOpts()
+    cnopts.hostkeys = None  # Disable host key checking
+    cnopts.compression = True
+
+    _sftp_connection = pysftp.Connection(
+        ftpinfo['host'],
+        username=ftpinfo['user'],
+        private_key=private_key_path,
+        private_key_pass=ftpinfo['passphrase'],
+        port=ftpinfo.get('port', 22),
+        cnopts=cnopts
+    )
+    return _sftp_connection
+
+
 def upload_calendar_to_server(calendar_path: str) -> bool:
     """Upload the generated calendar file to the server via SFTP.
 
@@ -69,42 +190,56 @@ def upload_calendar_to_server(calendar_path: str) -> bool:
         console.print("  [dim]Create ftpinfo.json with: host, user, private_key_path, passphrase, port[/dim]")
         return False
 
-    try:
-        with open(SFTP_CONFIG_PATH) as j:
-            ftpinfo = json.load(j)
-
-        host = ftpinfo['host']
-        user = ftpinfo['user']
-        private_key_path = ftpinfo['private_key_path']
-        passphrase = ftpinfo['passphrase']
-        port = ftpinfo.get('port', 22)
-
-        # Convert Windows path to WSL path if needed
-        private_key_path = _convert_windows_path_to_wsl(private_key_path)
-
-        console.print(f"  [dim]Connecting to SFTP server...[/dim]")
-
-        cnopts = pysftp.CnOpts()
-        cnopts.hostkeys = None  # Disable host key checking
-
-        with pysftp.Connection(
-            host,
-            username=user,
-            private_key=private_key_path,
-            private_key_pass=passphrase,
-            port=port,
-            cnopts=cnopts
-        ) as sftp:
+    with _sftp_lock:
+        try:
+            with open(SFTP_CONFIG_PATH) as j:
+                ftpinfo = json.load(j)
+
+            sftp = _get_sftp_connection(pysftp, ftpinfo)
             remote_folder = settings.sftp_remote_folder
-            sftp.cwd(remote_folder)
-            sftp.put(calendar_path)
+            # Upload by path rather than cwd: the cached connection keeps its
+            # working directory between uploads, so a relative folder would
+            # otherwise nest deeper on every call
+            sftp.put(
+                calendar_path,
+                remotepath=posixpath.join(remote_folder, Path(calendar_path).name)
+            )
             console.print(f"  [green]✅ Calendar uploaded to server: {remote_folder}/[/green]")
 
-        return True
+            return True
 
-    except Exception as e:
-        console.print(f"  [red]❌ SFTP upload failed: {e}[/red]")
-        return False
+        except Exception as e:
+            # Drop the connection so the next upload starts from a fresh handshake
+            _close_sftp_connection()
+            console.print(f"  [red]❌ SFTP upload failed: {e}[/red]")
+            return False
+
+
+@functools.lru_cache(maxsize=1)
+def _get_git_origin_url() -> Optional[str]:
+    """Get the URL of the ``origin`` remote (cached, it never changes mid-process)."""
+    import subprocess
+
+    result = subprocess.run(
+        ["git", "remote", "get-url", "origin"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        stdin=subprocess.DEVNULL,
+        check=False
+    )
+    if result.returncode != 0:
+        return None
+    return result.stdout.decode('utf-8', errors='replace').strip()
+
+
+def _save_calendar_push_marker(calendar_mtime: Optional[int]) -> None:
+    """Record the calendar mtime that is now in sync with the GitHub repo."""
+    if calendar_mtime is None:
+        return
+    try:
+        CALENDAR_PUSH_MARKER_PATH.write_text(str(calendar_mtime))
+    except OSError:
+        pass
 
 
 def upload_calendar_to_github(calendar_path: str) -> bool:
@@ -121,82 +256,94 @@ def upload_calendar_to_github(calendar_path: str) -> bool:
     """
     import subprocess
 
+    # Skip git entirely if the calendar hasn't been modified since the last push
     try:
-        # Get the project root directory (where .git should be)
-        project_root = Path(__file__).parent.parent
+        calendar_mtime = os.stat(calendar_path).st_mtime_ns
+        if CALENDAR_PUSH_MARKER_PATH.read_text().strip() == str(calendar_mtime):
+            console.print("  [dim]No changes to calendar file. Skipping commit.[/dim]")
+            return True
+    except (OSError, ValueError):
+        calendar_mtime = None
 
-        # Check if we're in a git repository
+    try:
+        # Check repository and calendar file state in one call:
+        # nonzero exit means not a git repository, empty output means no changes
         result = subprocess.run(
-            ["git", "rev-parse", "--is-inside-work-tree"],
-            cwd=project_root,
+            ["git", "status", "--porcelain", "--", CALENDAR_RELATIVE_PATH],
+            cwd=PROJECT_ROOT,
             capture_output=True,
-            text=True
+            stdin=subprocess.DEVNULL,
+            check=False
         )
         if result.returncode != 0:
             console.print("  [yellow]⚠️  Not a git repository. Skipping GitHub upload.[/yellow]")
             return False
 
-        # Check if there are changes to the calendar file
-        result = subprocess.run(
-            ["git", "status", "--porcelain", CALENDAR_RELATIVE_PATH],
-            cwd=project_root,
-            capture_output=True,
-            text=True
-        )
-        if not result.stdout.strip():
+        status = result.stdout.decode('utf-8', errors='replace').strip()
+        if not status:
             console.print("  [dim]No changes to calendar file. Skipping commit.[/dim]")
+            _save_calendar_push_marker(calendar_mtime)
             return True
 
-        # Add the calendar file
-        result = subprocess.run(
-            ["git", "add", CALENDAR_RELATIVE_PATH],
-            cwd=project_root,
-            capture_output=True,
-            text=True
-        )
-        if result.returncode != 0:
-            console.print(f"  [red]❌ Git add failed: {result.stderr}[/red]")
-            return False
+        # Untracked files must be added before a pathspec commit can include them
+        if status.startswith("??"):
+            result = subprocess.run(
+                ["git", "add", "--", CALENDAR_RELATIVE_PATH],
+                cwd=PROJECT_ROOT,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                stdin=subprocess.DEVNULL,
+                check=False
+            )
+            if result.returncode != 0:
+                console.print(f"  [red]❌ Git add failed: {result.stderr.decode('utf-8', errors='replace')}[/red]")
+                return False
 
-        # Commit with a timestamp
+        # Stage and commit the calendar file in one step, with a timestamp
         commit_msg = f"Update calendar: {datetime.now().strftime('%Y-%m-%d %H:%M')}"
         result = subprocess.run(
-            ["git", "commit", "-m", commit_msg],
-            cwd=project_root,
+            ["git", "commit", "-m", commit_msg, "--", CALENDAR_RELATIVE_PATH],
+            cwd=PROJECT_ROOT,
             capture_output=True,
-            text=True
+            stdin=subprocess.DEVNULL,
+            check=False
         )
         if result.returncode != 0:
+            stdout = result.stdout.decode('utf-8', errors='replace')
+            stderr = result.stderr.decode('utf-8', errors='replace')
             # Check if it's just "nothing to commit"
-            if "nothing to commit" in result.stdout or "nothing to commit" in result.stderr:
+            if "nothing to commit" in stdout or "nothing to commit" in stderr:
                 console.print("  [dim]No changes to commit.[/dim]")
                 return True
-            console.print(f"  [red]❌ Git commit failed: {result.stderr}[/red]")
+            console.print(f"  [red]❌ Git commit failed: {stderr}[/red]")
             return False
 
         console.print(f"  [dim]Committed: {commit_msg}[/dim]")
 
-        # Push to remote
-        result = subprocess.run(
-            ["git", "push"],
-            cwd=project_root,
-            capture_output=True,
-            text=True
-        )
+        # Push to remote, resolving the origin URL while the push is in flight.
+        # Only stderr is read (for the error message), so stdout is discarded
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            origin_future = executor.submit(_get_git_origin_url)
+            # Protocol v2 trims ref advertisement; hooks are skipped for this data-only push
+            result = subprocess.run(
+                ["git", "-c", "protocol.version=2", "push", "--no-verify", "--atomic"],
+                cwd=PROJECT_ROOT,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                stdin=subprocess.DEVNULL,
+                check=False
+            )
         if result.returncode != 0:
-            console.print(f"  [yellow]⚠️  Git push failed: {result.stderr}[/yellow]")
+            console.print(f"  [yellow]⚠️  Git push failed: {result.stderr.decode('utf-8', errors='replace')}[/yellow]")
             console.print("  [dim]Calendar committed locally. Push manually when ready.[/dim]")
             return False
 
+        console.print(f"  [green]✅ Calendar pushed to GitHub[/green]")
+        _save_calendar_push_marker(calendar_mtime)
+
         # Get remote URL for user reference
-        result = subprocess.run(
-            ["git", "remote", "get-url", "origin"],
-            cwd=project_root,
-            capture_output=True,
-            text=True
-        )
-        if result.returncode == 0:
-            remote_url = result.stdout.strip()
+        remote_url = origin_future.result()
+        if remote_url:
             # Convert SSH URL to HTTPS raw URL
             if remote_url.startswith("git@github.com:"):
                 # git@github.com:user/repo.git -> https://raw.githubusercontent.com/user/repo/main/
@@ -209,11 +356,8 @@ def upload_calendar_to_github(calendar_path: str) -> bool:
             else:
                 raw_url = None
 
-            console.print(f"  [green]✅ Calendar pushed to GitHub[/green]")
             if raw_url:
                 console.print(f"  [dim]Subscribe URL: {raw_url}[/dim]")
-        else:
-            console.print(f"  [green]✅ Calendar pushed to GitHub[/green]")
 
         return True
 
@@ -225,6 +369,28 @@ def upload_calendar_to_github(calendar_path: str) -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=1)
+def _get_github_client():
+    """Get a shared HTTP client for the GitHub API.
+
+    The client keeps a connection pool, so the create-on-404 fallback and
+    later uploads in the same process (daily-auto) reuse the TLS connection
+    to api.github.com instead of handshaking again.
+    """
+    import httpx
+
+    return httpx.Client(
+        base_url="https://api.github.com",
+        headers={
+            "Accept": "application/vnd.github.v3+json",
+            "Content-Type": "application/json",
+            "User-Agent": "BIP-Calendar-Uploader"
+        },
+        timeout=30.0,
+        limits=httpx.Limits(max_connections=4, max_keepalive_connections=2)
+    )
+
+
 def upload_calendar_to_gist(calendar_path: str) -> bool:
     """Upload the calendar file to GitHub Gist for easy subscription.
 
@@ -239,9 +405,6 @@ def upload_calendar_to_gist(calendar_path: str) -> bool:
     Returns:
         True if upload successful, False otherwise
     """
-    import urllib.request
-    import urllib.error
-
     if not settings.github_gist_token:
         console.print("  [yellow]⚠️  GITHUB_GIST_TOKEN not set in .env[/yellow]")
         console.print("  [dim]Create a token at: GitHub → Settings → Developer settings → Personal access tokens[/dim]")
@@ -249,96 +412,76 @@ def upload_calendar_to_gist(calendar_path: str) -> bool:
         return False
 
     try:
-        # Read calendar content
-        with open(calendar_path, 'r', encoding='utf-8') as f:
-            calendar_content = f.read()
-
         filename = "bip-daily-calendar.ics"
         gist_description = "BIP Calendar - Auto-updated task calendar"
 
-        headers = {
-            "Authorization": f"token {settings.github_gist_token}",
-            "Accept": "application/vnd.github.v3+json",
-            "Content-Type": "application/json",
-            "User-Agent": "BIP-Calendar-Uploader"
-        }
+        # Read the calendar once; the payload is shared by the update request
+        # and the create fallback
+        with open(calendar_path, 'r', encoding='utf-8') as f:
+            payload = {
+                "description": gist_description,
+                "files": {filename: {"content": f.read()}},
+            }
+
+        client = _get_github_client()
+        headers = {"Authorization": f"token {settings.github_gist_token}"}
 
         # Load gist ID from env or data file
         gist_id = _load_gist_id()
 
         if gist_id:
             # Update existing gist
-            url = f"https://api.github.com/gists/{gist_id}"
-            data = json.dumps({
-                "description": gist_description,
-                "files": {
-                    filename: {"content": calendar_content}
-                }
-            }).encode('utf-8')
-
-            req = urllib.request.Request(url, data=data, headers=headers, method='PATCH')
-
-            try:
-                with urllib.request.urlopen(req) as response:
-                    result = json.loads(response.read().decode('utf-8'))
-                    raw_url = result['files'][filename]['raw_url']
-                    # Remove the commit hash from URL for stable subscription
-                    # https://gist.githubusercontent.com/user/id/raw/commit/file -> https://gist.githubusercontent.com/user/id/raw/file
-                    parts = raw_url.split('/raw/')
-                    if len(parts) == 2:
-                        stable_url = f"{parts[0]}/raw/{filename}"
-                    else:
-                        stable_url = raw_url
-
-                    console.print(f"  [green]✅ Calendar updated on GitHub Gist[/green]")
-                    console.print(f"  [cyan]📅 Subscribe URL:[/cyan]")
-                    console.print(f"  [bold cyan]{stable_url}[/bold cyan]")
-                    return True
-            except urllib.error.HTTPError as e:
-                if e.code == 404:
-                    console.print(f"  [yellow]⚠️  Gist {gist_id} not found. Creating new gist...[/yellow]")
-                    # Clear the invalid gist ID and create new
-                    gist_id = None
-                else:
-                    raise
-
-        # Create new gist
-        if not gist_id:
-            url = "https://api.github.com/gists"
-            data = json.dumps({
-                "description": gist_description,
-                "public": True,
-                "files": {
-                    filename: {"content": calendar_content}
-                }
-            }).encode('utf-8')
-
-            req = urllib.request.Request(url, data=data, headers=headers, method='POST')
-
-            with urllib.request.urlopen(req) as response:
-                result = json.loads(response.read().decode('utf-8'))
-                gist_id = result['id']
-                raw_url = result['files'][filename]['raw_url']
-
-                # Create stable URL without commit hash
+            response = client.patch(f"/gists/{gist_id}", json=payload, headers=headers)
+
+            if response.status_code == 404:
+                console.print(f"  [yellow]⚠️  Gist {gist_id} not found. Creating new gist...[/yellow]")
+                # Clear the invalid gist ID and create new
+                gist_id = None
+            elif response.is_success:
+                raw_url = response.json()['files'][filename]['raw_url']
+                # Remove the commit hash from URL for stable subscription
+                # https://gist.githubusercontent.com/user/id/raw/commit/file -> https://gist.githubusercontent.com/user/id/raw/file
                 parts = raw_url.split('/raw/')
                 if len(parts) == 2:
                     stable_url = f"{parts[0]}/raw/{filename}"
                 else:
                     stable_url = raw_url
 
-                console.print(f"  [green]✅ Calendar uploaded to new GitHub Gist[/green]")
+                console.print(f"  [green]✅ Calendar updated on GitHub Gist[/green]")
                 console.print(f"  [cyan]📅 Subscribe URL:[/cyan]")
                 console.print(f"  [bold cyan]{stable_url}[/bold cyan]")
-                # Save gist ID for future updates
-                _save_gist_id(gist_id)
-
                 return True
+            else:
+                console.print(f"  [red]❌ GitHub API error ({response.status_code}): {response.text}[/red]")
+                return False
+
+        # Create new gist
+        if not gist_id:
+            response = client.post("/gists", json={**payload, "public": True}, headers=headers)
+
+            if not response.is_success:
+                console.print(f"  [red]❌ GitHub API error ({response.status_code}): {response.text}[/red]")
+                return False
+
+            result = response.json()
+            gist_id = result['id']
+            raw_url = result['files'][filename]['raw_url']
+
+            # Create stable URL without commit hash
+            parts = raw_url.split('/raw/')
+            if len(parts) == 2:
+                stable_url = f"{parts[0]}/raw/{filename}"
+            else:
+                stable_url = raw_url
+
+            console.print(f"  [green]✅ Calendar uploaded to new GitHub Gist[/green]")
+            console.print(f"  [cyan]📅 Subscribe URL:[/cyan]")
+            console.print(f"  [bold cyan]{stable_url}[/bold cyan]")
+            # Save gist ID for future updates
+            _save_gist_id(gist_id)
+
+            return True
 
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode('utf-8') if e.fp else str(e)
-        console.print(f"  [red]❌ GitHub API error ({e.code}): {error_body}[/red]")
-        return False
     except Exception as e:
         console.print(f"  [red]❌ Gist upload failed: {e}[/red]")
         return False
@@ -353,58 +496,61 @@ def _save_gist_id(gist_id: str) -> None:
     which persists across container restarts. The gist ID is loaded from this
     file if GITHUB_GIST_ID is not set in environment.
     """
-    project_root = Path(__file__).parent.parent
-
     # Always save to data directory (works in Docker since data/ is mounted)
-    data_dir = project_root / "data"
+    data_dir = PROJECT_ROOT / "data"
     data_dir.mkdir(exist_ok=True)
     gist_id_file = data_dir / "gist_id.txt"
+    _load_gist_id.cache_clear()
 
     try:
-        with open(gist_id_file, 'w', encoding='utf-8') as f:
-            f.write(gist_id)
-        console.print(f"  [dim]✅ Gist ID saved to data/gist_id.txt[/dim]")
+        # Skip the write if the file already holds this ID
+        if not (gist_id_file.exists() and gist_id_file.read_bytes() == gist_id.encode('utf-8')):
+            gist_id_file.write_bytes(gist_id.encode('utf-8'))
+            console.print(f"  [dim]✅ Gist ID saved to data/gist_id.txt[/dim]")
     except Exception as e:
         console.print(f"  [yellow]⚠️  Could not save gist ID to file: {e}[/yellow]")
 
     # Also try to update .env (works for local non-Docker usage)
     try:
-        env_path = project_root / ".env"
+        env_path = PROJECT_ROOT / ".env"
         if env_path.exists():
             with open(env_path, 'r', encoding='utf-8') as f:
                 content = f.read()
 
+            # Nothing to do if .env already has this exact ID
+            existing = _GIST_ID_LINE_RE.search(content)
+            if existing and existing.group(0).rstrip('\r') == f'GITHUB_GIST_ID={gist_id}':
+                return
+
             # Check if GITHUB_GIST_ID already exists
-            if 'GITHUB_GIST_ID=' in content:
+            if existing:
                 # Update existing line
-                content = re.sub(
-                    r'^GITHUB_GIST_ID=.*$',
-                    f'GITHUB_GIST_ID={gist_id}',
-                    content,
-                    flags=re.MULTILINE
-                )
+                content = _GIST_ID_LINE_RE.sub(f'GITHUB_GIST_ID={gist_id}', content)
             else:
                 # Append new line
                 if not content.endswith('\n'):
                     content += '\n'
                 content += f'GITHUB_GIST_ID={gist_id}\n'
 
-            with open(env_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            env_path.write_bytes(content.encode('utf-8'))
             console.print(f"  [dim]✅ GITHUB_GIST_ID also saved to .env[/dim]")
     except Exception:
         # Silent fail for .env - Docker users won't have write access
         pass
 
 
+@functools.lru_cache(maxsize=1)
 def _load_gist_id() -> Optional[str]:
-    """Load gist ID from environment or data/gist_id.txt file."""
+    """Load gist ID from environment or data/gist_id.txt file.
+
+    Cached for the life of the process; _save_gist_id clears the cache.
+    """
     # First check environment variable
     if settings.github_gist_id:
         return settings.github_gist_id
 
     # Then check data file (for Docker users)
-    gist_id_file = Path(__file__).parent.parent / "data" / "gist_id.txt"
+    gist_id_file = PROJECT_ROOT / "data" / "gist_id.txt"
     if gist_id_file.exists():
         try:
             with open(gist_id_file, 'r', encoding='utf-8') as f:
@@ -417,36 +563,86 @@ def _load_gist_id() -> Optional[str]:
     return None
 
 
+def _run_upload_captured(upload_fn, calendar_path: str) -> str:
+    """Run an upload function, capturing its console output.
+
+    Rich's capture buffer is thread-local, so each worker thread gets its
+    own buffer and concurrent uploads don't interleave their messages.
+    """
+    with console.capture() as capture:
+        upload_fn(calendar_path)
+    return capture.get()
+
+
 def upload_calendar(output_file, show_header: bool = True) -> None:
     """Upload calendar to configured destinations (Gist, GitHub repo, and/or SFTP).
 
+    Destinations are independent, so when more than one is enabled they are
+    uploaded concurrently and each one's output is printed as it completes.
+
     Args:
         output_file: Path to the calendar .ics file
         show_header: Whether to show upload header messages
     """
+    destinations = []
+
     # Upload to GitHub Gist (recommended, enabled by default)
     if settings.calendar_upload_gist:
-        if show_header:
-            console.print("\n[bold]📤 Uploading calendar to GitHub Gist...[/bold]")
-        upload_calendar_to_gist(str(output_file))
+        destinations.append(("GitHub Gist", upload_calendar_to_gist))
 
     # Upload to GitHub repo (disabled by default, requires fork or own repo)
     if settings.calendar_upload_github:
-        if show_header:
-            console.print("\n[bold]📤 Uploading calendar to GitHub repo...[/bold]")
-        upload_calendar_to_github(str(output_file))
+        destinations.append(("GitHub repo", upload_calendar_to_github))
 
     # Upload to SFTP server (disabled by default)
     if settings.calendar_upload_sftp:
+        destinations.append(("SFTP server", upload_calendar_to_server))
+
+    if len(destinations) == 1:
+        label, upload_fn = destinations[0]
         if show_header:
-            console.print("\n[bold]📤 Uploading calendar to SFTP server...[/bold]")
-        upload_calendar_to_server(str(output_file))
+            console.print(f"\n[bold]📤 Uploading calendar to {label}...[/bold]")
+        upload_fn(str(output_file))
+        return
+
+    with ThreadPoolExecutor(max_workers=len(destinations)) as executor:
+        futures = {
+            executor.submit(_run_upload_captured, upload_fn, str(output_file)): label
+            for label, upload_fn in destinations
+        }
+        for future in as_completed(futures):
+            if show_header:
+                console.print(f"\n[bold]📤 Uploading calendar to {futures[future]}...[/bold]")
+            console.print(Text.from_ansi(future.result()))
 
 
 @click.group()
-def cli():
+@click.option('--debug', is_flag=True, envvar='BIP_DEBUG', help='Show full tracebacks on errors')
+@click.pass_context
+def cli(ctx, debug):
     """Build-in-Public Daily Posting System."""
-    pass
+    ctx.ensure_object(dict)
+    ctx.obj['debug'] = debug
+
+
+def _print_banner(title: str, style: str = "bold cyan", leading: str = "\n", trailing: str = "") -> None:
+    """Print a title between two 60-char rules in a single console write.
+
+    Args:
+        title: Banner text (may contain markup)
+        style: Rich style applied to the rules and title
+        leading: Text printed before the banner (a blank line by default)
+        trailing: Text printed after the banner
+    """
+    rule = "=" * 60
+    console.print(f"{leading}[{style}]{rule}\n{title}\n{rule}[/{style}]{trailing}")
+
+
+def _print_debug_traceback() -> None:
+    """Print the traceback of the exception being handled, if --debug is set."""
+    ctx = click.get_current_context(silent=True)
+    if ctx is not None and ctx.obj and ctx.obj.get('debug'):
+        console.print(traceback.format_exc())
 
 
 @cli.command()
@@ -477,27 +673,69 @@ def _extract_image_prompts_from_content(content: str) -> tuple:
     Returns:
         Tuple of (content_without_prompts, image_prompts_section)
     """
-    import re
-
     # Look for ## Image Prompts or ## 图片生成提示 section
-    patterns = [
-        r'\n## Image Prompts\s*\n',
-        r'\n## 图片生成提示\s*\n',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, content)
-        if match:
-            split_pos = match.start()
-            post_content = content[:split_pos].rstrip()
-            image_prompts = content[split_pos:].strip()
-            return post_content, image_prompts
+    match = _IMAGE_PROMPTS_RE.search(content)
+    if match:
+        split_pos = match.start()
+        post_content = content[:split_pos].rstrip()
+        image_prompts = content[split_pos:].strip()
+        return post_content, image_prompts
 
     # No image prompts section found
     return content, None
 
 
-def save_post_to_markdown(post: PostRecord, output_dir: str = "data/selected_posts") -> Path:
+# Markdown layout for posts saved by save_post_to_markdown()
+_POST_MARKDOWN_TEMPLATE = """# {style_upper} - Build in Public Post
+
+**Post ID:** {id}
+**Generated:** {generated}
+**Word Count:** {word_count}
+**Status:** {status}
+
+---
+
+## Hashtags
+
+{hashtags}
+
+---
+
+## Content
+
+{content}
+
+---
+
+## Metadata
+
+- **Projects Mentioned:** {projects}
+- **Technical Keywords:** {keywords}
+- **Selected At:** {selected_at}
+
+---
+
+*Ready for manual publishing to Xiaohongshu*
+"""
+
+# Markdown layout for the image-prompt file saved alongside each post
+_IMAGE_PROMPT_MARKDOWN_TEMPLATE = """# Image Generation Prompts - Post {id}
+
+**Generated at:** {generated}
+**For use with:** Gemini Imagen 3 API
+**Associated post:** {filename}
+
+---
+
+{image_prompts}
+"""
+
+
+def save_post_to_markdown(
+    post: PostRecord,
+    output_dir: str = "data/selected_posts",
+    now: Optional[datetime] = None
+) -> Path:
     """Save a selected post to a markdown file for manual publishing.
 
     Extracts Image Prompts section and saves to separate file.
@@ -505,17 +743,21 @@ def save_post_to_markdown(post: PostRecord, output_dir: str = "data/selected_pos
     Args:
         post: PostRecord to save
         output_dir: Directory to save the markdown file
+        now: Timestamp for the filename and image-prompt header
+             (defaults to the current time; pass one in when saving a batch)
 
     Returns:
         Path to the saved markdown file
     """
+    if now is None:
+        now = datetime.now()
+
     # Create output directory if it doesn't exist
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
     # Generate filename with timestamp and post ID
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    base_filename = f"post_{timestamp}_id{post.id}"
+    base_filename = f"post_{now:%Y%m%d_%H%M%S}_id{post.id}"
     filename = f"{base_filename}.md"
     filepath = output_path / filename
 
@@ -523,69 +765,100 @@ def save_post_to_markdown(post: PostRecord, output_dir: str = "data/selected_pos
     post_content, image_prompts = _extract_image_prompts_from_content(post.content)
 
     # Prepare markdown content with metadata (without image prompts)
-    markdown_content = f"""# {post.style.upper()} - Build in Public Post
+    markdown_content = _POST_MARKDOWN_TEMPLATE.format_map({
+        "style_upper": post.style.upper(),
+        "id": post.id,
+        "generated": post.created_at.strftime("%Y-%m-%d %H:%M:%S"),
+        "word_count": post.word_count,
+        "status": post.status,
+        "hashtags": '#' + ' #'.join(post.hashtags) if post.hashtags else '',
+        "content": post_content,
+        "projects": ', '.join(post.projects_mentioned) if post.projects_mentioned else 'None',
+        "keywords": ', '.join(post.technical_keywords[:10]) if post.technical_keywords else 'None',
+        "selected_at": post.selected_at.strftime("%Y-%m-%d %H:%M:%S") if post.selected_at else 'N/A',
+    })
 
-**Post ID:** {post.id}
-**Generated:** {post.created_at.strftime("%Y-%m-%d %H:%M:%S")}
-**Word Count:** {post.word_count}
-**Status:** {post.status}
-
----
-
-## Hashtags
-
-{' '.join(['#' + tag for tag in post.hashtags])}
+    # Write post to file
+    filepath.write_bytes(markdown_content.encode('utf-8'))
 
----
+    # Save image prompts to separate file if extracted
+    if image_prompts:
+        image_prompt_filename = f"image-prompt_{base_filename}.md"
+        image_prompt_filepath = output_path / image_prompt_filename
+        image_prompt_content = _IMAGE_PROMPT_MARKDOWN_TEMPLATE.format_map({
+            "id": post.id,
+            "generated": f"{now:%Y-%m-%d %H:%M:%S}",
+            "filename": filename,
+            "image_prompts": image_prompts,
+        })
+        image_prompt_filepath.write_bytes(image_prompt_content.encode('utf-8'))
+        console.print(f"    🎨 Image prompts saved to: {image_prompt_filepath}")
+    else:
+        console.print(f"    ⚠️  No image prompts found in post content")
 
-## Content
+    return filepath
 
-{post_content}
 
----
 
-## Metadata
+def _save_posts_to_markdown(records: List[PostRecord], now: Optional[datetime] = None) -> None:
+    """Save a batch of posts with save_post_to_markdown, writing files concurrently.
 
-- **Projects Mentioned:** {', '.join(post.projects_mentioned) if post.projects_mentioned else 'None'}
-- **Technical Keywords:** {', '.join(post.technical_keywords[:10]) if post.technical_keywords else 'None'}
-- **Selected At:** {post.selected_at.strftime("%Y-%m-%d %H:%M:%S") if post.selected_at else 'N/A'}
+    Results are reported in record order once all files are written.
 
----
+    Args:
+        records: Committed PostRecords to save
+        now: Timestamp passed through to save_post_to_markdown
+    """
+    if not records:
+        return
 
-*Ready for manual publishing to Xiaohongshu*
-"""
+    # Reading the ids loads any attributes expired by the commit here, in the
+    # session's thread; the workers then only read already-loaded values
+    post_ids = [record.id for record in records]
 
-    # Write post to file
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(markdown_content)
+    with ThreadPoolExecutor(max_workers=min(8, len(records))) as executor:
+        futures = [executor.submit(save_post_to_markdown, record, now=now) for record in records]
 
-    # Save image prompts to separate file if extracted
-    if image_prompts:
-        image_prompt_filename = f"image-prompt_{base_filename}.md"
-        image_prompt_filepath = output_path / image_prompt_filename
-        image_prompt_content = f"""# Image Generation Prompts - Post {post.id}
+    for post_id, future in zip(post_ids, futures):
+        try:
+            console.print(f"   ✅ Saved: {future.result().name}")
+        except Exception as e:
+            console.print(f"   [yellow]⚠️  Failed to save post #{post_id}: {e}[/yellow]")
 
-**Generated at:** {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
-**For use with:** Gemini Imagen 3 API
-**Associated post:** {filename}
 
----
+def _find_image_prompt_file(selected_posts_dir: Path, post_id: int) -> Optional[Path]:
+    """Find the image-prompt file saved by save_post_to_markdown for a post.
 
-{image_prompts}
-"""
-        with open(image_prompt_filepath, 'w', encoding='utf-8') as f:
-            f.write(image_prompt_content)
-        console.print(f"    🎨 Image prompts saved to: {image_prompt_filepath}")
-    else:
-        console.print(f"    ⚠️  No image prompts found in post content")
+    Stops at the first "image-prompt_*_id<post_id>.md" entry instead of
+    globbing the whole (ever-growing) directory into a list.
 
-    return filepath
+    Args:
+        selected_posts_dir: Directory the post markdown files are saved in
+        post_id: Database ID of the post
 
+    Returns:
+        Path to the image-prompt file, or None if there isn't one
+    """
+    prefix = "image-prompt_"
+    suffix = f"_id{post_id}.md"
+    min_length = len(prefix) + len(suffix)
+    try:
+        with os.scandir(selected_posts_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if len(name) >= min_length and name.startswith(prefix) and name.endswith(suffix):
+                    return Path(entry.path)
+    except OSError:
+        pass
+    return None
 
 @cli.command()
 @click.option('--days', default=None, type=int, help='Days to look back')
 def collect(days):
     """Collect data from all sources."""
+    from src.collectors.aggregator import DataAggregator
+    from rich.table import Table
+
     lookback = days or settings.lookback_days
 
     console.print(f"[bold]📦 Collecting data from past {lookback} days...[/bold]\n")
@@ -617,6 +890,9 @@ def collect(days):
 @click.option('--days', default=None, type=int, help='Days to look back')
 def generate(count, days):
     """Generate posts for today."""
+    from src.collectors.aggregator import DataAggregator
+    from src.generators.post_generator import PostGenerator
+
     post_count = count or settings.posts_per_day
     lookback = days or settings.lookback_days
 
@@ -632,37 +908,18 @@ def generate(count, days):
 
     # Save to database
     session = get_session()
-    saved_posts = []
-
-    for i, post in enumerate(posts, 1):
-        record = PostRecord(
-            generation_date=datetime.now(),
-            content=post.content,
-            style=post.style.value,
-            language=post.language.value,
-            hashtags=post.hashtags,
-            word_count=post.word_count,
-            projects_mentioned=post.projects_mentioned,
-            technical_keywords=post.technical_keywords,
-            source_data=data.model_dump(mode='json'),
-            generation_metadata=post.metadata,
-            status=PostStatus.DRAFT.value,
-        )
-        session.add(record)
-        saved_posts.append(record)
+    now = datetime.now()
+    source_data = data.model_dump(mode='json')
+    saved_posts = [PostRecord.from_generated(post, source_data, now) for post in posts]
 
+    session.add_all(saved_posts)
     session.commit()
 
     console.print(f"[bold green]✅ Generated and saved {len(posts)} posts to database![/bold green]")
 
     # Auto-save ALL posts to selected_posts directory
     console.print(f"\n[bold]📁 Auto-saving all {len(saved_posts)} posts to selected_posts/...[/bold]")
-    for record in saved_posts:
-        try:
-            filepath = save_post_to_markdown(record)
-            console.print(f"   ✅ Saved: {filepath.name}")
-        except Exception as e:
-            console.print(f"   [yellow]⚠️  Failed to save post #{record.id}: {e}[/yellow]")
+    _save_posts_to_markdown(saved_posts, now=now)
 
     console.print(f"\n   Use 'python -m src.cli select' to choose which one to post\n")
 
@@ -670,13 +927,18 @@ def generate(count, days):
 @cli.command()
 def select():
     """Select a post to publish."""
+    from rich.markdown import Markdown
+    from rich.panel import Panel
+    from rich.prompt import Confirm, IntPrompt
+    from sqlalchemy import select as sa_select
+
     session = get_session()
 
-    # Get today's draft posts
-    today = datetime.now().date()
-    posts = session.query(PostRecord).filter(
+    # Get the latest draft posts (served by the status/created_at index)
+    stmt = sa_select(PostRecord).where(
         PostRecord.status == PostStatus.DRAFT.value,
-    ).order_by(PostRecord.created_at.desc()).limit(10).all()
+    ).order_by(PostRecord.created_at.desc()).limit(10)
+    posts = session.execute(stmt).scalars().all()
 
     if not posts:
         console.print("[yellow]⚠️  No draft posts found. Generate some first![/yellow]")
@@ -688,7 +950,7 @@ def select():
     # Display posts
     for i, post in enumerate(posts, 1):
         # Add language flag
-        lang_flag = "🇨🇳" if post.language == "zh" else "🇬🇧"
+        lang_flag = _language_flag(post.language)
         lang_name = "Chinese" if post.language == "zh" else "English"
 
         console.print(Panel(
@@ -724,10 +986,15 @@ def select():
     selected_post.status = PostStatus.SELECTED.value
     selected_post.selected_at = datetime.now()
 
-    # Reject other posts from same generation
-    for post in posts:
-        if post.id != selected_post.id and post.status == PostStatus.DRAFT.value:
-            post.status = PostStatus.REJECTED.value
+    # Reject other posts from same generation in a single UPDATE
+    other_ids = [
+        p.id for p in posts
+        if p.id != selected_post.id and p.status == PostStatus.DRAFT.value
+    ]
+    if other_ids:
+        session.query(PostRecord).filter(
+            PostRecord.id.in_(other_ids)
+        ).update({PostRecord.status: PostStatus.REJECTED.value}, synchronize_session=False)
 
     session.commit()
 
@@ -780,8 +1047,10 @@ def publish_post(post_id: int):
     Args:
         post_id: Post database ID
     """
+    from src.publishers.xiaohongshu import XiaohongshuPublisher
+
     session = get_session()
-    post = session.query(PostRecord).filter_by(id=post_id).first()
+    post = session.get(PostRecord, post_id)
 
     if not post:
         console.print(f"[red]❌ Post {post_id} not found[/red]")
@@ -798,7 +1067,7 @@ def publish_post(post_id: int):
         publisher = XiaohongshuPublisher()
         result = publisher.publish(
             content=post.content,
-            title=post.content.split('\n')[0][:50],  # First line as title
+            title=post.title,  # First line as title
         )
 
         # Update post record
@@ -824,6 +1093,8 @@ def publish_to_twitter(post_id: int):
     Args:
         post_id: Post database ID
     """
+    from src.publishers.twitter import TwitterPublisher
+
     session = get_session()
     post = session.query(PostRecord).filter_by(id=post_id).first()
 
@@ -866,55 +1137,136 @@ def publish_to_twitter(post_id: int):
         console.print("   Please check your Twitter credentials")
 
 
+def _paginate_no_count(query, limit: int) -> Tuple[list, bool]:
+    """Fetch one page of a query without a COUNT(*) round trip.
+
+    Args:
+        query: Ordered SQLAlchemy query
+        limit: Page size
+
+    Returns:
+        Tuple of (rows for this page, whether more rows follow)
+    """
+    rows = query.limit(limit + 1).all()
+    return rows[:limit], len(rows) > limit
+
+
 @cli.command()
 @click.option('--limit', default=10, type=int, help='Number of posts to show')
-def history(limit):
-    """View post history."""
+@click.option('--before-id', default=None, type=int, help='Only show posts older than this post ID (next page)')
+def history(limit, before_id):
+    """View post history.
+
+    Pages are fetched by post ID (keyset pagination): pass the ID printed
+    after a page as --before-id to continue from there without rescanning.
+    Large limits (over HISTORY_TABLE_MAX_ROWS) are streamed as CSV instead of
+    a rich table, whose layout cost grows quickly with row count.
+    """
+    import csv
+    import sys
+
     session = get_session()
-    posts = session.query(PostRecord).order_by(
-        PostRecord.created_at.desc()
-    ).limit(limit).all()
+    # Only the displayed columns - avoids hydrating full PostRecord objects
+    query = session.query(
+        PostRecord.id,
+        PostRecord.language,
+        PostRecord.created_at,
+        PostRecord.style,
+        PostRecord.word_count,
+        PostRecord.status,
+        PostRecord.published_at,
+    )
+    if before_id is not None:
+        query = query.filter(PostRecord.id < before_id)
+    # IDs increase with creation time, so the primary key gives newest-first order
+    query = query.order_by(PostRecord.id.desc())
+
+    if limit > HISTORY_TABLE_MAX_ROWS:
+        writer = csv.writer(sys.stdout)
+        writer.writerow(["id", "language", "created_at", "style", "word_count", "status", "published_at"])
+        # One extra row tells whether there is a next page (as in the table view)
+        last_id = None
+        has_next = False
+        for written, row in enumerate(query.limit(limit + 1).yield_per(200)):
+            if written == limit:
+                has_next = True
+                break
+            writer.writerow([
+                row.id,
+                row.language,
+                row.created_at.isoformat(sep=' ', timespec='minutes'),
+                row.style,
+                row.word_count,
+                row.status,
+                row.published_at.date().isoformat() if row.published_at else "",
+            ])
+            last_id = row.id
+
+        # The cursor goes to stderr so stdout stays plain CSV
+        if has_next:
+            click.echo(f"Older posts: --before-id {last_id}", err=True)
+        return
+
+    from rich.table import Table
+
+    posts, has_next = _paginate_no_count(query, limit)
 
     if not posts:
         console.print("[yellow]No posts found[/yellow]")
         return
 
     table = Table(title=f"Post History (Last {len(posts)})")
-    table.add_column("ID", style="cyan")
-    table.add_column("Lang", style="magenta")
-    table.add_column("Date", style="green")
-    table.add_column("Style", style="blue")
-    table.add_column("Words", justify="right")
-    table.add_column("Status", style="yellow")
-    table.add_column("Published")
+    for header, style, justify in _HISTORY_COLUMNS:
+        table.add_column(header, style=style, justify=justify)
 
     for post in posts:
-        lang_flag = "🇨🇳" if post.language == "zh" else "🇬🇧"
         table.add_row(
             str(post.id),
-            lang_flag,
-            post.created_at.strftime("%Y-%m-%d %H:%M"),
+            _language_flag(post.language),
+            post.created_at.isoformat(sep=' ', timespec='minutes'),
             post.style,
             str(post.word_count),
             post.status,
-            post.published_at.strftime("%Y-%m-%d") if post.published_at else "-",
+            post.published_at.date().isoformat() if post.published_at else "-",
         )
 
     console.print(table)
 
+    if has_next:
+        console.print(f"[dim]Older posts: --before-id {posts[-1].id}[/dim]")
+
 
 @cli.command()
 @click.argument('post_id', type=int)
 def view(post_id):
     """View a specific post."""
+    from rich.markdown import Markdown
+    from rich.panel import Panel
+    from sqlalchemy.orm import load_only
+
     session = get_session()
-    post = session.query(PostRecord).filter_by(id=post_id).first()
+    # Load only the displayed columns; source_data holds the whole collection run
+    post = session.query(PostRecord).options(load_only(
+        PostRecord.content,
+        PostRecord.style,
+        PostRecord.language,
+        PostRecord.status,
+        PostRecord.word_count,
+        PostRecord.created_at,
+        PostRecord.hashtags,
+        PostRecord.projects_mentioned,
+        PostRecord.technical_keywords,
+        PostRecord.xhs_url,
+        PostRecord.published_at,
+        PostRecord.twitter_url,
+        PostRecord.twitter_published_at,
+    )).filter_by(id=post_id).first()
 
     if not post:
         console.print(f"[red]Post {post_id} not found[/red]")
         return
 
-    lang_flag = "🇨🇳" if post.language == "zh" else "🇬🇧"
+    lang_flag = _language_flag(post.language)
     lang_name = "Chinese" if post.language == "zh" else "English"
 
     console.print(Panel(
@@ -924,26 +1276,40 @@ def view(post_id):
         border_style="cyan"
     ))
 
-    # Show metadata
-    console.print(f"\n[bold]Metadata:[/bold]")
-    console.print(f"  Hashtags: {', '.join(post.hashtags)}")
-    console.print(f"  Projects: {', '.join(post.projects_mentioned)}")
-    console.print(f"  Keywords: {', '.join(post.technical_keywords[:10])}")
+    # Show metadata (collected into one print so Rich renders it once)
+    hashtags_str = ', '.join(post.hashtags)
+    projects_str = ', '.join(post.projects_mentioned)
+    keywords_str = ', '.join(post.technical_keywords[:10])
+    lines = [
+        "\n[bold]Metadata:[/bold]",
+        f"  Hashtags: {hashtags_str}",
+        f"  Projects: {projects_str}",
+        f"  Keywords: {keywords_str}",
+    ]
 
     if post.xhs_url:
-        console.print(f"\n[bold]Xiaohongshu:[/bold]")
-        console.print(f"  URL: {post.xhs_url}")
-        console.print(f"  Published: {post.published_at.strftime('%Y-%m-%d %H:%M')}")
+        lines += [
+            "\n[bold]Xiaohongshu:[/bold]",
+            f"  URL: {post.xhs_url}",
+            f"  Published: {post.published_at.strftime('%Y-%m-%d %H:%M')}",
+        ]
 
     if post.twitter_url:
-        console.print(f"\n[bold]X.com (Twitter):[/bold]")
-        console.print(f"  URL: {post.twitter_url}")
-        console.print(f"  Published: {post.twitter_published_at.strftime('%Y-%m-%d %H:%M') if post.twitter_published_at else 'N/A'}")
+        twitter_published = post.twitter_published_at.strftime('%Y-%m-%d %H:%M') if post.twitter_published_at else 'N/A'
+        lines += [
+            "\n[bold]X.com (Twitter):[/bold]",
+            f"  URL: {post.twitter_url}",
+            f"  Published: {twitter_published}",
+        ]
+
+    console.print("\n".join(lines))
 
 
 @cli.command()
 def calendar():
     """Generate ICS calendar from project todos with dates."""
+    from src.generators.calendar_generator import CalendarGenerator
+
     console.print("[bold]📅 Generating BIP Daily Calendar...[/bold]\n")
 
     try:
@@ -994,8 +1360,7 @@ def reschedule():
 
     except Exception as e:
         console.print(f"[red]❌ Reschedule failed: {e}[/red]")
-        import traceback
-        console.print(traceback.format_exc())
+        _print_debug_traceback()
 
 
 @cli.command('temp-post')
@@ -1011,6 +1376,8 @@ def temp_post():
     - post.md: The generated post content
     - post.ready: Marker indicating the folder has been processed
     """
+    from src.generators.temp_post_generator import TempPostGenerator
+
     console.print("[bold]📝 Processing Temp Posts...[/bold]\n")
 
     try:
@@ -1030,8 +1397,7 @@ def temp_post():
 
     except Exception as e:
         console.print(f"[red]❌ Temp post processing failed: {e}[/red]")
-        import traceback
-        console.print(traceback.format_exc())
+        _print_debug_traceback()
 
 
 def run_temp_post_check() -> Tuple[int, int]:
@@ -1040,6 +1406,8 @@ def run_temp_post_check() -> Tuple[int, int]:
     Returns:
         Tuple of (processed_count, failed_count)
     """
+    from src.generators.temp_post_generator import TempPostGenerator
+
     try:
         generator = TempPostGenerator()
         return generator.process_all_unprocessed()
@@ -1057,30 +1425,23 @@ def save_temp_post_to_db(folder_path: Path) -> Optional[PostRecord]:
     Returns:
         PostRecord if successful, None otherwise
     """
-    # Find post.md file
-    post_file = folder_path / "post.md"
-    if not post_file.exists():
-        # Try alternative filename
-        post_file = folder_path / "post_链接内容无法获取.md"
-        if not post_file.exists():
+    try:
+        # Read post.md file (or the alternative filename)
+        for post_filename in TEMP_POST_FILENAMES:
+            try:
+                content = (folder_path / post_filename).read_text(encoding='utf-8')
+                break
+            except FileNotFoundError:
+                continue
+        else:
             console.print(f"  [yellow]⚠️  No post.md found in {folder_path.name}[/yellow]")
             return None
 
-    try:
-        with open(post_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-
         # Extract actual post content (skip metadata header)
         # File format: metadata header, ---, content (may have multiple --- separators), ---
-        if "---" in content:
-            parts = content.split("---")
-            if len(parts) >= 2:
-                # Skip first part (metadata), join the rest with ---
-                main_parts = parts[1:]
-                content = "---".join(main_parts).strip()
-                # Remove trailing --- if present
-                if content.endswith("---"):
-                    content = content[:-3].strip()
+        match = _TEMP_POST_BODY_RE.search(content)
+        if match:
+            content = match.group(1)
 
         # Remove Image Prompts section if present
         post_content, _ = _extract_image_prompts_from_content(content)
@@ -1110,12 +1471,13 @@ def save_temp_post_to_db(folder_path: Path) -> Optional[PostRecord]:
         return None
 
 
-def schedule_temp_post(folder_name: str, platforms: List[str] = None) -> bool:
+def schedule_temp_post(folder_name: str, platforms: List[str] = None, scheduler=None) -> bool:
     """Schedule a temp post for publishing.
 
     Args:
         folder_name: Name of the folder in data/temp_posts/
         platforms: List of platforms to publish to (default: twitter only)
+        scheduler: Optional PostScheduler to reuse across several posts
 
     Returns:
         True if scheduled successfully
@@ -1135,7 +1497,8 @@ def schedule_temp_post(folder_name: str, platforms: List[str] = None) -> bool:
         return False
 
     # Schedule the post using the scheduler's session
-    scheduler = PostScheduler()
+    if scheduler is None:
+        scheduler = PostScheduler()
 
     # Re-query the post using the scheduler's session to avoid session conflicts
     post = scheduler.session.query(PostRecord).filter(PostRecord.id == post.id).first()
@@ -1169,39 +1532,52 @@ def list_temp_posts_for_scheduling() -> List[dict]:
     if not temp_posts_dir.exists():
         return posts
 
-    for folder in temp_posts_dir.iterdir():
-        if not folder.is_dir():
-            continue
+    ready_folders = []
+    has_images = {}
+    with os.scandir(temp_posts_dir) as entries:
+        for entry in entries:
+            # is_dir() uses the cached dirent type, no extra stat()
+            if not entry.is_dir():
+                continue
 
-        # Check if has post.ready (processed)
-        ready_file = folder / "post.ready"
-        if not ready_file.exists():
-            continue
+            # One directory listing instead of a stat() per marker file
+            filenames = set(os.listdir(entry.path))
 
-        # Check if already published (has publish.ready marker)
-        publish_ready = folder / "publish.ready"
-        if publish_ready.exists():
-            continue  # Skip already published posts
+            # Check if has post.ready (processed)
+            if "post.ready" not in filenames:
+                continue
 
-        # Check if has post.md
-        post_file = folder / "post.md"
-        if not post_file.exists():
-            post_file = folder / "post_链接内容无法获取.md"
-            if not post_file.exists():
+            # Check if already published (has publish.ready marker)
+            if "publish.ready" in filenames:
+                continue  # Skip already published posts
+
+            # Check if has post.md
+            if filenames.isdisjoint(TEMP_POST_FILENAMES):
                 continue
 
-        # Check if already in database
-        session = get_session()
-        existing = session.query(PostRecord).filter(
-            PostRecord.generation_metadata.contains(folder.name)
-        ).first()
+            ready_folders.append(Path(entry.path))
+            has_images[entry.name] = "images.ready" in filenames
 
+    if not ready_folders:
+        return posts
+
+    # Check which folders are already in database with one (indexed) query
+    session = get_session()
+    rows = session.query(PostRecord.id, post_folder_name).filter(
+        post_folder_name.in_([folder.name for folder in ready_folders])
+    ).order_by(PostRecord.id).all()
+    existing_ids = {}
+    for post_id, folder_name in rows:
+        existing_ids.setdefault(folder_name, post_id)
+
+    for folder in ready_folders:
+        post_id = existing_ids.get(folder.name)
         posts.append({
             "folder_name": folder.name,
             "folder_path": folder,
-            "has_images": (folder / "images.ready").exists(),
-            "already_scheduled": existing is not None,
-            "post_id": existing.id if existing else None
+            "has_images": has_images[folder.name],
+            "already_scheduled": post_id is not None,
+            "post_id": post_id
         })
 
     return posts
@@ -1222,6 +1598,7 @@ def generate_images(platform: str, force: bool):
     The generated images are saved in an 'images' subfolder with:
     - images/cover.png (and other named images if multiple prompts exist)
     - images.ready marker file when complete
+    - images.skipped marker file if the post has no image prompts
 
     Image generation uses Gemini Imagen 3 API with automatic fallback to Gemini Flash.
 
@@ -1230,6 +1607,8 @@ def generate_images(platform: str, force: bool):
         ./bip generate-images --platform twitter # Twitter 16:9 dimensions
         ./bip generate-images --force            # Regenerate all images
     """
+    from src.generators.image_generator import ImageGenerator
+
     console.print("[bold]🎨 Generating Post Images...[/bold]\n")
 
     try:
@@ -1253,36 +1632,66 @@ def generate_images(platform: str, force: bool):
 
     except Exception as e:
         console.print(f"[red]❌ Image generation failed: {e}[/red]")
-        import traceback
-        console.print(traceback.format_exc())
+        _print_debug_traceback()
 
 
-def run_image_generation(platform: str = "xiaohongshu") -> Tuple[int, int, int]:
+@functools.lru_cache(maxsize=1)
+def _get_image_generator():
+    """Get a shared ImageGenerator.
+
+    Building one creates the Gemini/OpenAI clients (and their HTTP
+    connection pools), so daily-auto's hourly checks and the selected-post
+    step reuse a single instance instead of reconnecting each time.
+    """
+    from src.generators.image_generator import ImageGenerator
+
+    return ImageGenerator()
+
+
+def run_image_generation(platform: str = "xiaohongshu", pending=None) -> Tuple[int, int, int]:
     """Run image generation (for use in daily-auto).
 
     Args:
         platform: Target platform for image dimensions
+        pending: Posts from ImageGenerator.find_unprocessed_posts(), if the
+            caller already scanned for them
 
     Returns:
         Tuple of (processed_count, failed_count, skipped_count)
     """
     try:
-        generator = ImageGenerator()
-        return generator.process_unprocessed_posts(platform=platform)
+        generator = _get_image_generator()
+        return generator.process_unprocessed_posts(platform=platform, pending=pending)
     except Exception as e:
         console.print(f"[red]❌ Image generation failed: {e}[/red]")
         return 0, 0, 0
 
 
-def auto_schedule_temp_posts(platforms: List[str] = None) -> Tuple[int, int]:
+def list_schedulable_temp_posts() -> List[dict]:
+    """List ready temp posts that have images but no post record yet.
+
+    Returns:
+        List of dicts with folder info (see list_temp_posts_for_scheduling)
+    """
+    return [
+        post for post in list_temp_posts_for_scheduling()
+        if post["has_images"] and not post["already_scheduled"]
+    ]
+
+
+def auto_schedule_temp_posts(platforms: List[str] = None, schedulable: List[dict] = None) -> Tuple[int, int]:
     """Auto-schedule temp posts that have images but are not yet scheduled.
 
     Args:
         platforms: List of platforms to schedule for (default: twitter only)
+        schedulable: Posts from list_schedulable_temp_posts(), if the caller
+            already listed them
 
     Returns:
         Tuple of (scheduled_count, failed_count)
     """
+    from src.schedulers.post_scheduler import PostScheduler
+
     if platforms is None:
         platforms = ["twitter"]
 
@@ -1290,22 +1699,24 @@ def auto_schedule_temp_posts(platforms: List[str] = None) -> Tuple[int, int]:
     failed_count = 0
 
     try:
-        # Get all temp posts ready for scheduling
-        posts = list_temp_posts_for_scheduling()
-
-        # Filter for posts that have images but are not yet scheduled
-        schedulable = [p for p in posts if p["has_images"] and not p["already_scheduled"]]
+        # Temp posts that have images but are not yet scheduled
+        if schedulable is None:
+            schedulable = list_schedulable_temp_posts()
 
         if not schedulable:
             return 0, 0
 
         console.print(f"\n[bold]📅 Auto-scheduling {len(schedulable)} temp post(s)...[/bold]")
 
+        # One scheduler (and session) for the whole batch. Posts are scheduled
+        # one at a time because each slot choice depends on the previous ones
+        scheduler = PostScheduler()
+
         for post_info in schedulable:
             folder_name = post_info["folder_name"]
             console.print(f"  📝 Scheduling: {folder_name}")
 
-            success = schedule_temp_post(folder_name, platforms)
+            success = schedule_temp_post(folder_name, platforms, scheduler=scheduler)
             if success:
                 scheduled_count += 1
             else:
@@ -1324,18 +1735,22 @@ def check_today_meeting_exists() -> Optional[Path]:
         Path to existing meeting file if found, None otherwise
     """
     meetings_dir = Path(settings.base_dir) / "data" / "meetings"
-    if not meetings_dir.exists():
-        return None
+    prefix = f"meeting_{datetime.now():%Y%m%d}_"
 
-    today_str = datetime.now().strftime('%Y%m%d')
-    pattern = f"meeting_{today_str}_*.md"
+    # Find the most recent meeting file from today in a single pass
+    latest_path = None
+    latest_mtime = -1.0
+    try:
+        with os.scandir(meetings_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith(prefix) and entry.name.endswith('.md'):
+                    mtime = entry.stat().st_mtime
+                    if mtime > latest_mtime:
+                        latest_path, latest_mtime = entry.path, mtime
+    except FileNotFoundError:
+        return None
 
-    # Find any meeting file from today
-    existing_files = list(meetings_dir.glob(pattern))
-    if existing_files:
-        # Return the most recent one
-        return max(existing_files, key=lambda f: f.stat().st_mtime)
-    return None
+    return Path(latest_path) if latest_path else None
 
 
 @cli.command()
@@ -1352,6 +1767,9 @@ def meeting(save):
 
     Usage: ./bip meeting
     """
+    from src.managers.meeting_manager import MeetingManager
+    from rich.markdown import Markdown
+
     console.print("[bold]🌅 Starting Morning Meeting...[/bold]\n")
 
     try:
@@ -1365,9 +1783,14 @@ def meeting(save):
         console.print(f"   {filepath}")
 
         # Summary stats
-        total_commits = sum(len(p.yesterday_commits) for p in report.projects)
-        total_tasks = sum(len(p.today_tasks) for p in report.projects)
-        blocked_projects = [p.name for p in report.projects if "Blocked" in p.health]
+        total_commits = 0
+        total_tasks = 0
+        blocked_projects = []
+        for p in report.projects:
+            total_commits += len(p.yesterday_commits)
+            total_tasks += len(p.today_tasks)
+            if "Blocked" in p.health:
+                blocked_projects.append(p.name)
 
         console.print(f"\n[bold]📊 Summary:[/bold]")
         console.print(f"   Yesterday's commits: {total_commits}")
@@ -1379,13 +1802,15 @@ def meeting(save):
 
     except Exception as e:
         console.print(f"[red]❌ Meeting failed: {e}[/red]")
-        import traceback
-        console.print(traceback.format_exc())
+        _print_debug_traceback()
 
 
 @cli.command()
 def daily():
     """Run daily workflow: collect → generate → select → publish."""
+    from src.collectors.aggregator import DataAggregator
+    from src.generators.post_generator import PostGenerator
+
     console.print("[bold]🌅 Running daily Build-in-Public workflow...[/bold]\n")
 
     # Step 1: Collect data
@@ -1403,25 +1828,12 @@ def daily():
     generator = PostGenerator()
     posts = generator.generate_multiple_posts(data, count=settings.posts_per_day)
 
-    # Save posts
+    # Save posts (ids aren't needed afterwards, so skip the unit-of-work bookkeeping)
     session = get_session()
-    saved_posts = []
-    for post in posts:
-        record = PostRecord(
-            generation_date=datetime.now(),
-            content=post.content,
-            style=post.style.value,
-            language=post.language.value,
-            hashtags=post.hashtags,
-            word_count=post.word_count,
-            projects_mentioned=post.projects_mentioned,
-            technical_keywords=post.technical_keywords,
-            source_data=data.model_dump(mode='json'),
-            generation_metadata=post.metadata,
-            status=PostStatus.DRAFT.value,
-        )
-        session.add(record)
-        saved_posts.append(record)
+    now = datetime.now()
+    source_data = data.model_dump(mode='json')
+    records = [PostRecord.from_generated(post, source_data, now) for post in posts]
+    session.bulk_save_objects(records, return_defaults=False)
     session.commit()
 
     console.print(f"   ✅ Generated {len(posts)} posts")
@@ -1430,7 +1842,40 @@ def daily():
     console.print(f"\n[bold cyan]👆 Step 3: Select post to publish[/bold cyan]")
     console.print("   Run: python -m src.cli select")
 
-    console.print(f"\n[bold green]✨ Daily workflow complete![/bold green]")
+    console.print(f"\n[bold green]✨ Daily workflow complete![/bold green]")
+
+
+def _sleep_until_next_status(remaining: float, status_interval: int, max_wait: Optional[float] = None) -> None:
+    """Sleep until the remaining wait time reaches the next status_interval mark.
+
+    Waits wake up only when there is something to report, instead of
+    polling the clock every minute.
+
+    Args:
+        remaining: Seconds left until the target time
+        status_interval: Seconds between status messages
+        max_wait: Optional cap on the sleep (e.g. to wake for hourly work)
+    """
+    wait_seconds = remaining % status_interval or status_interval
+    if max_wait is not None:
+        wait_seconds = min(wait_seconds, max_wait)
+    _wait_event.wait(wait_seconds)
+
+
+def _sleep_until(target: datetime) -> None:
+    """Sleep until the wall clock reaches target.
+
+    One timed wait instead of a polling loop; the clock is re-checked after
+    waking in case the wait returned early (e.g. after a system suspend).
+
+    Args:
+        target: Local time to wake at
+    """
+    while True:
+        remaining = (target - datetime.now()).total_seconds()
+        if remaining <= 0:
+            return
+        _wait_event.wait(remaining)
 
 
 def wait_until_time(target_hour: int, target_minute: int = 0) -> bool:
@@ -1457,18 +1902,17 @@ def wait_until_time(target_hour: int, target_minute: int = 0) -> bool:
     console.print(f"   Current time: {now.strftime('%H:%M:%S')}")
     console.print(f"   Wait time: {int(wait_seconds // 3600)}h {int((wait_seconds % 3600) // 60)}m")
 
-    # Show countdown every 10 minutes
-    while datetime.now() < target:
-        remaining = (target - datetime.now()).total_seconds()
-        if remaining > 0:
-            # Sleep in 60-second intervals for responsiveness
-            sleep_time = min(60, remaining)
-            time.sleep(sleep_time)
+    # Show countdown every 10 minutes (one clock read per wake-up)
+    remaining = wait_seconds
+    while remaining > 0:
+        # Sleep straight to the next 10-minute mark
+        _sleep_until_next_status(remaining, 600)
 
-            # Show status every 10 minutes
-            remaining_after = (target - datetime.now()).total_seconds()
-            if int(remaining // 600) != int(remaining_after // 600):  # Every 10 min
-                console.print(f"   ⏳ {int(remaining_after // 60)} minutes remaining...")
+        # Show status every 10 minutes
+        remaining_after = (target - datetime.now()).total_seconds()
+        if remaining_after > 0 and int(remaining // 600) != int(remaining_after // 600):  # Every 10 min
+            console.print(f"   ⏳ {int(remaining_after // 60)} minutes remaining...")
+        remaining = remaining_after
 
     console.print(f"   [green]✅ Target time reached: {datetime.now().strftime('%H:%M:%S')}[/green]")
     return True
@@ -1482,31 +1926,34 @@ def auto_select_post() -> Optional[PostRecord]:
     """
     session = get_session()
 
-    # Get recent draft posts, prefer Chinese
-    posts = session.query(PostRecord).filter(
+    # Get recent draft posts (ids and languages only), prefer Chinese
+    drafts = session.query(PostRecord.id, PostRecord.language).filter(
         PostRecord.status == PostStatus.DRAFT.value,
     ).order_by(PostRecord.created_at.desc()).limit(10).all()
 
-    if not posts:
+    if not drafts:
         console.print("[yellow]⚠️  No draft posts found for auto-select[/yellow]")
         return None
 
     # Prefer Chinese post
-    chinese_posts = [p for p in posts if p.language == "zh"]
-    selected_post = chinese_posts[0] if chinese_posts else posts[0]
+    selected_id = next((d.id for d in drafts if d.language == "zh"), drafts[0].id)
+
+    # Reject other posts from same generation in one UPDATE
+    other_ids = [d.id for d in drafts if d.id != selected_id]
+    if other_ids:
+        session.query(PostRecord).filter(
+            PostRecord.id.in_(other_ids),
+            PostRecord.status == PostStatus.DRAFT.value,
+        ).update({PostRecord.status: PostStatus.REJECTED.value}, synchronize_session=False)
 
     # Update status
+    selected_post = session.get(PostRecord, selected_id)
     selected_post.status = PostStatus.SELECTED.value
     selected_post.selected_at = datetime.now()
 
-    # Reject other posts from same generation
-    for post in posts:
-        if post.id != selected_post.id and post.status == PostStatus.DRAFT.value:
-            post.status = PostStatus.REJECTED.value
-
     session.commit()
 
-    lang_flag = "🇨🇳" if selected_post.language == "zh" else "🇬🇧"
+    lang_flag = _language_flag(selected_post.language)
     console.print(f"[bold green]✅ Auto-selected post #{selected_post.id} {lang_flag}[/bold green]")
 
     # Save to markdown file
@@ -1539,7 +1986,7 @@ def auto_publish_post(post: PostRecord) -> bool:
         publisher = XiaohongshuPublisher()
         result = publisher.publish(
             content=post.content,
-            title=post.content.split('\n')[0][:50],
+            title=post.title,
         )
 
         # Update post record
@@ -1592,7 +2039,7 @@ def wait_until_time_with_hourly_check(target_hour: int, target_minute: int = 0)
     img_total_failed = 0
 
     # Show countdown and check hourly
-    while datetime.now() < target:
+    while True:
         current_time = datetime.now()
         remaining = (target - current_time).total_seconds()
 
@@ -1619,9 +2066,9 @@ def wait_until_time_with_hourly_check(target_hour: int, target_minute: int = 0)
                 console.print(f"   [dim]No new temp posts[/dim]")
             last_check_hour = current_time.hour
 
-        # Sleep in 60-second intervals for responsiveness
-        sleep_time = min(60, remaining)
-        time.sleep(sleep_time)
+        # Sleep to the next 10-minute mark, or the top of the hour if sooner
+        next_hour = current_time.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+        _sleep_until_next_status(remaining, 600, max_wait=(next_hour - current_time).total_seconds())
 
         # Show status every 10 minutes
         remaining_after = (target - datetime.now()).total_seconds()
@@ -1658,17 +2105,16 @@ def wait_until_morning_start():
     console.print(f"   Current time: {now.strftime('%H:%M:%S')}")
     console.print(f"   Wait time: {int(wait_seconds // 3600)}h {int((wait_seconds % 3600) // 60)}m")
 
-    while datetime.now() < target:
-        remaining = (target - datetime.now()).total_seconds()
-        if remaining <= 0:
-            break
-        sleep_time = min(60, remaining)
-        time.sleep(sleep_time)
+    # One clock read per wake-up
+    remaining = wait_seconds
+    while remaining > 0:
+        _sleep_until_next_status(remaining, 1800)
 
         # Show status every 30 minutes
         remaining_after = (target - datetime.now()).total_seconds()
-        if int(remaining // 1800) != int(remaining_after // 1800):
+        if remaining_after > 0 and int(remaining // 1800) != int(remaining_after // 1800):
             console.print(f"   ⏳ {int(remaining_after // 60)} minutes until {settings.daily_start_hour:02d}:00...")
+        remaining = remaining_after
 
     console.print(f"   [green]✅ {settings.daily_start_hour:02d}:00 reached! Starting daily workflow...[/green]")
     return True
@@ -1692,9 +2138,9 @@ def run_reschedule_procedure():
     Returns:
         Tuple of (rescheduled_count, calendar_path)
     """
-    console.print("\n[bold magenta]" + "=" * 60 + "[/bold magenta]")
-    console.print("[bold magenta]📋 SMART AUTO-RESCHEDULE PROCEDURE (23:00)[/bold magenta]")
-    console.print("[bold magenta]" + "=" * 60 + "[/bold magenta]\n")
+    from src.generators.calendar_generator import CalendarGenerator
+
+    _print_banner("📋 SMART AUTO-RESCHEDULE PROCEDURE (23:00)", style="bold magenta", trailing="\n")
 
     # Load project directories from config
     # Projects are configured in config/projects.yaml or via environment variables
@@ -1705,12 +2151,15 @@ def run_reschedule_procedure():
     # Weekly time budget for startup projects (in hours)
     # Users should customize this based on their projects
     # Default: equal distribution among configured projects
+    weekly_total_hours = 17  # 17 hours/week total
     num_projects = len(project_dirs)
-    default_hours = 17 // max(num_projects, 1)  # 17 hours/week total
+    default_hours = weekly_total_hours // max(num_projects, 1)
     project_weekly_hours = {name: default_hours for name in project_dirs}
 
     # Daily max hours per project (weekly / 7, rounded up for flexibility)
     project_daily_max = {k: max(1, v / 5) for k, v in project_weekly_hours.items()}  # 5 working days
+    # Daily max hours across all projects
+    daily_total_max = weekly_total_hours / 5
 
     today = datetime.now().date()
     three_days_ago = today - timedelta(days=2)
@@ -1723,128 +2172,143 @@ def run_reschedule_procedure():
         if guide_path.exists():
             try:
                 with open(guide_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    # Extract first 500 chars as summary
-                    project_contexts[project_name] = content[:500]
+                    # Extract first 500 chars as summary (no need to read the rest)
+                    project_contexts[project_name] = f.read(500)
                 console.print(f"  ✅ {project_name}: guide.md loaded")
             except Exception as e:
                 console.print(f"  ⚠️  {project_name}: Failed to read guide.md - {e}")
         else:
             console.print(f"  ℹ️  {project_name}: No guide.md found")
 
+    # Find and read each project's launch plan files once; steps 2 and 3 share
+    # the list and the files' text. Projects are independent directory walks,
+    # so they are loaded concurrently
+    launch_file_text = {}
+    launch_load_errors = {}  # path -> error from the one read attempt
+    existing_project_dirs = {
+        name: Path(path) for name, path in project_dirs.items() if Path(path).exists()
+    }
+    with ThreadPoolExecutor(max_workers=min(8, max(len(existing_project_dirs), 1))) as executor:
+        found = executor.map(_find_launch_plan_files, existing_project_dirs.values())
+        launch_files_by_project = dict(zip(existing_project_dirs, found))
+
+        # Nothing to reschedule if no launch plan changed since a run today
+        # that found no undone tasks - skip reading and parsing them
+        launch_plan_signature = _launch_plan_signature(launch_files_by_project)
+        reschedule_manifest = {"date": today.isoformat(), "files": launch_plan_signature}
+        if _load_reschedule_manifest() == reschedule_manifest:
+            console.print("\n[green]✅ No launch plan changes since the last check - no undone tasks[/green]")
+            console.print("\n[bold]📅 Regenerating calendar...[/bold]")
+            cal_generator = CalendarGenerator()
+            output_file = cal_generator.generate_calendar()
+            # Upload to configured destinations
+            upload_calendar(output_file)
+            return 0, output_file
+
+        loaded = executor.map(_read_launch_plans, launch_files_by_project.values())
+        for text_by_file, errors_by_file in loaded:
+            launch_file_text.update(text_by_file)
+            launch_load_errors.update(errors_by_file)
+
     # Step 2: Collect all scheduled tasks across projects for conflict detection
     console.print("\n[bold]📅 Step 2: Collecting existing schedules for conflict detection...[/bold]\n")
-    existing_schedules = {}  # date -> list of (project, task, duration)
-
-    for project_name, project_path in project_dirs.items():
-        project_dir = Path(project_path)
-        if not project_dir.exists():
-            continue
+    project_day_hours = {}  # (project, date) -> scheduled hours
 
-        for file_path in project_dir.rglob("*.md"):
-            filename_lower = file_path.name.lower()
-            if "launch" in filename_lower and "plan" in filename_lower:
-                if "_archived_" in str(file_path):
-                    continue
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    # Parse scheduled tasks
-                    current_date = None
-                    for line in content.split('\n'):
-                        day_match = re.match(r'^\*\*Day\s+\d+\s*\(([^)]+)\)\*\*', line)
-                        if day_match:
-                            current_date = _parse_reschedule_date(day_match.group(1))
-                        elif current_date and re.match(r'^\s*[-*]?\s*\[.\]', line):
-                            # Extract duration if present
-                            duration_match = re.search(r'(\d+\.?\d*)\s*h', line)
-                            duration = float(duration_match.group(1)) if duration_match else 1.0
-                            date_key = current_date.date() if hasattr(current_date, 'date') else current_date
-                            if date_key not in existing_schedules:
-                                existing_schedules[date_key] = []
-                            existing_schedules[date_key].append((project_name, line.strip()[:50], duration))
-                except:
-                    pass
+    for project_name, launch_files in launch_files_by_project.items():
+        for file_path in launch_files:
+            content = launch_file_text.get(file_path)
+            if not content:
+                continue  # Unreadable (reported in step 3) or no day headers
+            # Parse scheduled tasks: one regex pass yields day headers and checkbox lines
+            hours_key = None  # (project, date) of the current day header
+            for match in _SCHEDULE_SCAN_RE.finditer(content):
+                if match.group(1):
+                    header_date = _parse_reschedule_date(match.group(1), today)
+                    hours_key = (project_name, header_date.date()) if header_date else None
+                elif hours_key:
+                    # Extract duration if present
+                    duration_match = _DURATION_RE.search(match.group(0))
+                    duration = float(duration_match.group(1)) if duration_match else 1.0
+                    project_day_hours[hours_key] = project_day_hours.get(hours_key, 0) + duration
 
     # Step 3: Find undone tasks from past 3 days
     console.print("[bold]🔍 Step 3: Scanning for undone tasks from past 3 days...[/bold]\n")
     undone_tasks = []
+    scan_report = []  # Printed in one go after the scan
 
-    for project_name, project_path in project_dirs.items():
-        project_dir = Path(project_path)
-        if not project_dir.exists():
-            console.print(f"  ⚠️  {project_name}: Directory not found")
+    for project_name in project_dirs:
+        if project_name not in launch_files_by_project:
+            scan_report.append(f"  ⚠️  {project_name}: Directory not found")
             continue
 
-        launch_files = []
-        for file_path in project_dir.rglob("*.md"):
-            filename_lower = file_path.name.lower()
-            if "launch" in filename_lower and "plan" in filename_lower:
-                if "_archived_" not in str(file_path):
-                    launch_files.append(file_path)
-
+        launch_files = launch_files_by_project[project_name]
         if not launch_files:
-            console.print(f"  ℹ️  {project_name}: No launch plan files")
+            scan_report.append(f"  ℹ️  {project_name}: No launch plan files")
             continue
 
-        console.print(f"  📁 {project_name}:")
+        scan_report.append(f"  📁 {project_name}:")
 
         for file_path in launch_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    lines = content.split('\n')
-
-                current_day_date = None
-                current_day_header_line = None
-                file_undone = []
-
-                for i, line in enumerate(lines):
-                    day_header_match = re.match(r'^(\*\*Day\s+\d+\s*\([^)]+\)\*\*.*)$', line, re.IGNORECASE)
-                    if day_header_match:
-                        date_part_match = re.search(r'\(([^)]+)\)', line)
-                        if date_part_match:
-                            parsed_date = _parse_reschedule_date(date_part_match.group(1))
-                            if parsed_date:
-                                current_day_date = parsed_date
-                                current_day_header_line = i
-                        continue
-
-                    completion_markers = ['✅', 'COMPLETED', '[x]', '[X]', 'done]', '[done', 'moved', 'postponed', '❌']
-                    if any(marker.lower() in line.lower() for marker in completion_markers):
-                        continue
-
-                    incomplete_match = re.match(r'^(\s*[-*]?\s*\[\s*\])\s*(.+)$', line)
-                    if incomplete_match and current_day_date:
-                        task_date = current_day_date.date() if hasattr(current_day_date, 'date') else current_day_date
-                        if isinstance(task_date, datetime):
-                            task_date = task_date.date()
-
-                        if three_days_ago <= task_date <= today:
-                            task_title = incomplete_match.group(2).strip()
-                            duration_match = re.search(r'(\d+\.?\d*)\s*h', task_title)
-                            duration = float(duration_match.group(1)) if duration_match else 1.0
-
-                            if len(task_title) >= 10:
-                                file_undone.append({
-                                    'project': project_name,
-                                    'file': file_path,
-                                    'line_num': i,
-                                    'line': line,
-                                    'task': task_title,
-                                    'original_date': current_day_date,
-                                    'duration': duration,
-                                    'day_header_line': current_day_header_line,
-                                })
-
-                if file_undone:
-                    console.print(f"      📄 {file_path.name}: {len(file_undone)} undone task(s)")
-                    undone_tasks.extend(file_undone)
+            if file_path in launch_load_errors:
+                scan_report.append(f"      ⚠️  Error reading {file_path.name}: {launch_load_errors[file_path]}")
+                continue
+            content = launch_file_text[file_path]
+
+            current_day_date = None
+            current_day_header_line = None
+            current_day_in_window = False  # Day falls within the past 3 days
+            file_undone = []
+
+            # One regex pass finds the day headers and unchecked tasks;
+            # newlines are only counted between matches for line numbers
+            i = 0
+            line_start = 0
+            for match in _UNDONE_SCAN_RE.finditer(content):
+                i += content.count('\n', line_start, match.start())
+                line_start = match.start()
+
+                if match.group(1):
+                    parsed_date = _parse_reschedule_date(match.group(1), today)
+                    if parsed_date:
+                        current_day_date = parsed_date
+                        current_day_header_line = i
+                        current_day_in_window = three_days_ago <= parsed_date.date() <= today
+                    continue
 
-            except Exception as e:
-                console.print(f"      ⚠️  Error reading {file_path.name}: {e}")
+                # Only unchecked tasks under a recent dated header can be undone tasks
+                if not current_day_in_window:
+                    continue
+
+                line = match.group(0)
+                if _COMPLETION_MARKER_RE.search(line):
+                    continue
+
+                task_title = match.group(3).strip()
+                duration_match = _DURATION_RE.search(task_title)
+                duration = float(duration_match.group(1)) if duration_match else 1.0
+
+                if len(task_title) >= 10:
+                    file_undone.append({
+                        'project': project_name,
+                        'file': file_path,
+                        'line_num': i,
+                        'line': line,
+                        'task': task_title,
+                        'original_date': current_day_date,
+                        'duration': duration,
+                        'day_header_line': current_day_header_line,
+                    })
+
+            if file_undone:
+                scan_report.append(f"      📄 {file_path.name}: {len(file_undone)} undone task(s)")
+                undone_tasks.extend(file_undone)
+
+    if scan_report:
+        console.print('\n'.join(scan_report), markup=False, highlight=False)
 
     if not undone_tasks:
+        if not launch_load_errors:
+            _save_reschedule_manifest(reschedule_manifest)
         console.print("\n[green]✅ No undone tasks found from the past 3 days![/green]")
         console.print("\n[bold]📅 Regenerating calendar...[/bold]")
         cal_generator = CalendarGenerator()
@@ -1857,9 +2321,12 @@ def run_reschedule_procedure():
 
     # Display undone tasks
     console.print("\n[bold]Undone Tasks:[/bold]")
+    undone_report = []
     for i, task in enumerate(undone_tasks, 1):
-        date_str = task['original_date'].strftime('%m/%d') if hasattr(task['original_date'], 'strftime') else str(task['original_date'])
-        console.print(f"  {i}. [{task['project']}] {date_str} ({task['duration']}h): {task['task'][:45]}...")
+        date_str = task['original_date'].strftime('%m/%d')
+        undone_report.append(f"  {i}. [{task['project']}] {date_str} ({task['duration']}h): {task['task'][:45]}...")
+    # Task text is plain, so skip markup parsing (and keep its brackets)
+    console.print('\n'.join(undone_report), markup=False, highlight=False)
 
     # Step 4: Smart rescheduling with conflict detection
     console.print("\n[bold]🧠 Step 4: Smart rescheduling with conflict detection...[/bold]\n")
@@ -1869,44 +2336,49 @@ def run_reschedule_procedure():
     console.print("[dim]  - FIRE API: ~1.4h/day (7h/week)[/dim]")
     console.print("[dim]  - Total startup: 17h/week[/dim]\n")
 
-    # Group undone tasks by project
-    tasks_by_project = {}
-    for task in undone_tasks:
-        if task['project'] not in tasks_by_project:
-            tasks_by_project[task['project']] = []
-        tasks_by_project[task['project']].append(task)
-
-    # Calculate rescheduled dates
+    # Calculate rescheduled dates in one sweep over the undone tasks, oldest
+    # first and larger tasks first within a day, so both the per-project and
+    # the shared daily budget are respected
     rescheduled_tasks = []
+    reschedule_report = []  # Printed in one go after the sweep
     tomorrow = today + timedelta(days=1)
 
-    for project_name, tasks in tasks_by_project.items():
-        daily_max = project_daily_max.get(project_name, 2)  # Default 2h/day
-        current_date = tomorrow
-        daily_hours_used = 0
+    day_total_hours = {}  # date -> hours across all projects
+    for (project_name, date_key), hours in project_day_hours.items():
+        day_total_hours[date_key] = day_total_hours.get(date_key, 0) + hours
 
-        for task in tasks:
-            # Check if adding this task exceeds daily limit
-            if daily_hours_used + task['duration'] > daily_max:
-                # Move to next day
-                current_date += timedelta(days=1)
-                daily_hours_used = 0
+    # Day loads only ever grow, so the first day that fits a given project
+    # and duration never moves earlier - resume the search from there
+    # instead of re-walking full days from tomorrow
+    search_start = {}  # (project, duration) -> first day that may have room
 
-            # Check for conflicts with existing schedule
-            while True:
-                date_schedule = existing_schedules.get(current_date, [])
-                project_hours = sum(d for p, t, d in date_schedule if p == project_name)
+    for task in sorted(undone_tasks, key=lambda t: (t['original_date'], -t['duration'])):
+        project_name = task['project']
+        daily_max = project_daily_max.get(project_name, 2)  # Default 2h/day
+        search_key = (project_name, task['duration'])
+        current_date = search_start.get(search_key, tomorrow)
+
+        # Move forward until the day has room for this project and overall.
+        # A task longer than the daily max goes on the next empty day
+        while True:
+            project_hours = project_day_hours.get((project_name, current_date), 0)
+            total_hours = day_total_hours.get(current_date, 0)
+            if total_hours == 0 or (
+                project_hours + task['duration'] <= daily_max
+                and total_hours + task['duration'] <= daily_total_max
+            ):
+                break
+            current_date += timedelta(days=1)
 
-                if project_hours + task['duration'] <= daily_max:
-                    break
-                current_date += timedelta(days=1)
-                daily_hours_used = 0
+        task['new_date'] = current_date
+        search_start[search_key] = current_date
+        project_day_hours[(project_name, current_date)] = project_hours + task['duration']
+        day_total_hours[current_date] = total_hours + task['duration']
+        rescheduled_tasks.append(task)
 
-            task['new_date'] = current_date
-            daily_hours_used += task['duration']
-            rescheduled_tasks.append(task)
+        reschedule_report.append(f"  📅 [{task['project']}] {task['original_date'].strftime('%m/%d')} → {current_date.strftime('%m/%d')}: {task['task'][:40]}...")
 
-            console.print(f"  📅 [{task['project']}] {task['original_date'].strftime('%m/%d')} → {current_date.strftime('%m/%d')}: {task['task'][:40]}...")
+    console.print('\n'.join(reschedule_report), markup=False, highlight=False)
 
     # Step 5: Actually update the launch plan files
     # IMPORTANT: This step ONLY adds markers - it NEVER removes any tasks!
@@ -1914,49 +2386,58 @@ def run_reschedule_procedure():
     console.print("\n[bold]✏️  Step 5: Updating launch plan files...[/bold]")
     console.print("[dim]   (Note: Tasks are only marked, never removed - preserving project history)[/dim]\n")
 
-    files_modified = set()
-    tasks_marked = 0
+    # Group by file so each launch plan is updated and written once
+    tasks_by_file = {}
     for task in rescheduled_tasks:
-        file_path = task['file']
-        new_date = task['new_date']
+        tasks_by_file.setdefault(task['file'], []).append(task)
 
+    files_modified = []  # Each file is handled once, so no dedupe is needed
+    tasks_marked = 0
+    for file_path, file_tasks in tasks_by_file.items():
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-
+            # Reuse the text scanned in step 3
+            lines = launch_file_text[file_path].split('\n')
             original_line_count = len(lines)
-
-            # Find or create the target day section
-            new_date_str = new_date.strftime('%b %d').replace(' 0', ' ')  # "Dec 18" format
-
-            # Find the line with this task and add a "moved" marker inside the [ ] checkbox
-            # IMPORTANT: We only ADD markers to existing lines, never remove any content
-            task_line = task['line_num']
-            if task_line < len(lines):
-                original_line = lines[task_line]
-                # Add moved marker inside the checkbox (only if not already marked)
-                if '[ ]' in original_line and '[moved to' not in original_line:
-                    # Mark as moved with new date inside the checkbox - preserving original task text
-                    moved_line = original_line.replace('[ ]', f'[moved to {new_date_str}]')
-                    lines[task_line] = moved_line
-                    tasks_marked += 1
+            file_marked = 0
+
+            for task in file_tasks:
+                # "Dec 18" format
+                new_date_str = task['new_date'].strftime('%b %d').replace(' 0', ' ')
+
+                # Find the line with this task and add a "moved" marker inside the [ ] checkbox
+                # IMPORTANT: We only ADD markers to existing lines, never remove any content
+                task_line = task['line_num']
+                if task_line < len(lines):
+                    original_line = lines[task_line]
+                    # Add moved marker inside the checkbox (only if not already marked)
+                    if '[ ]' in original_line and '[moved to' not in original_line:
+                        # Mark as moved with new date inside the checkbox - preserving original task text
+                        lines[task_line] = original_line.replace('[ ]', f'[moved to {new_date_str}]')
+                        file_marked += 1
+
+            # Nothing changed - leave the file untouched
+            if not file_marked:
+                continue
 
             # Safety check: ensure we're not removing any lines
             if len(lines) < original_line_count:
                 console.print(f"  [red]❌ SAFETY CHECK FAILED: Would remove lines from {file_path.name} - ABORTING[/red]")
                 continue
 
-            # Write back
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.writelines(lines)
+            # Write to a temp file and swap it in, so a crash can't truncate the plan
+            tmp_path = file_path.with_name(file_path.name + '.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write('\n'.join(lines))
+            os.replace(tmp_path, file_path)
 
-            files_modified.add(file_path)
+            tasks_marked += file_marked
+            files_modified.append(file_path)
 
         except Exception as e:
             console.print(f"  ⚠️  Failed to update {file_path.name}: {e}")
 
-    for file_path in files_modified:
-        console.print(f"  ✅ Updated: {file_path.name}")
+    if files_modified:
+        console.print('\n'.join(f"  ✅ Updated: {file_path.name}" for file_path in files_modified), markup=False, highlight=False)
 
     # Step 6: Regenerate calendar and upload
     console.print("\n[bold]📅 Step 6: Regenerating calendar with updated schedule...[/bold]")
@@ -1979,35 +2460,187 @@ def run_reschedule_procedure():
     return len(rescheduled_tasks), output_file
 
 
-def _parse_reschedule_date(date_str: str):
-    """Parse date from day header for reschedule."""
+# Launch plan patterns used by the reschedule procedure. The scans run over
+# a whole file, so horizontal whitespace is [^\S\n] to keep matches on one line.
+# "**Day 3 (Dec 18 - Thu)**" -> date text inside the parentheses
+_DAY_HEADER_PATTERN = r'^\*\*Day[^\S\n]+\d+[^\S\n]*\(([^)\n]+)\)\*\*'
+# Day header (group 1) or any checkbox line: "- [ ] ...", "- [x] ..."
+_SCHEDULE_SCAN_RE = re.compile(
+    _DAY_HEADER_PATTERN + r'|^[^\S\n]*[-*]?[^\S\n]*\[.\].*$',
+    re.IGNORECASE | re.MULTILINE
+)
+# Day header (group 1) or unchecked checkbox line -> (checkbox, task text)
+_UNDONE_SCAN_RE = re.compile(
+    _DAY_HEADER_PATTERN + r'|^([^\S\n]*[-*]?[^\S\n]*\[[^\S\n]*\])[^\S\n]*(.+)$',
+    re.IGNORECASE | re.MULTILINE
+)
+# Task duration such as "2h" or "1.5 h"
+_DURATION_RE = re.compile(r'(\d+\.?\d*)\s*h')
+# Trailing weekday in a day header date ("Dec 18 - Thu")
+_WEEKDAY_SUFFIX_RE = re.compile(r'\s*-\s*(Mon|Tue|Wed|Thu|Fri|Sat|Sun)\s*$', re.IGNORECASE)
+# "Dec 18" / "December 18"
+_MONTH_DAY_RE = re.compile(
+    r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2})',
+    re.IGNORECASE
+)
+
+# Lowercase month name/abbreviation -> month number
+_MONTH_NUMBERS = {
+    'january': 1, 'jan': 1, 'february': 2, 'feb': 2,
+    'march': 3, 'mar': 3, 'april': 4, 'apr': 4, 'may': 5,
+    'june': 6, 'jun': 6, 'july': 7, 'jul': 7, 'august': 8, 'aug': 8,
+    'september': 9, 'sep': 9, 'october': 10, 'oct': 10,
+    'november': 11, 'nov': 11, 'december': 12, 'dec': 12,
+}
+
+# Done/moved markers (case-insensitive) - lines with these aren't undone tasks
+_COMPLETION_MARKER_RE = re.compile(r'✅|completed|\[x\]|done\]|\[done|moved|postponed|❌', re.IGNORECASE)
+
+# Directories never searched for launch plans
+_LAUNCH_PLAN_SKIP_DIRS = frozenset({
+    ".git", "node_modules", ".venv", "venv", "__pycache__",
+    ".mypy_cache", ".pytest_cache", ".tox", "dist", "build",
+})
+
+
+def _find_launch_plan_files(project_dir: Path) -> List[Path]:
+    """Find the launch plan markdown files in a project, skipping archived ones.
+
+    Args:
+        project_dir: Project root directory
+
+    Returns:
+        List of launch plan file paths
+    """
+    if "_archived_" in str(project_dir):
+        return []
+
+    launch_files = []
+    # Depth-first scandir walk: DirEntry type checks need no extra stat, and
+    # dependency/VCS trees and archived folders are pruned before descending
+    stack = [str(project_dir)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                name = entry.name
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                if is_dir:
+                    if name not in _LAUNCH_PLAN_SKIP_DIRS and "_archived_" not in name:
+                        stack.append(entry.path)
+                    continue
+                if not name.endswith(".md") or "_archived_" in name:
+                    continue
+                name_lower = name.lower()
+                if "launch" in name_lower and "plan" in name_lower:
+                    launch_files.append(Path(entry.path))
+    return launch_files
+
+
+def _read_launch_plans(launch_files: List[Path]) -> Tuple[dict, dict]:
+    """Read each of a project's launch plan files once.
+
+    Args:
+        launch_files: Launch plan paths from _find_launch_plan_files
+
+    Returns:
+        Tuple of ({path: text} for the files that could be read,
+        {path: error} for the files that couldn't)
+    """
+    text_by_file = {}
+    errors_by_file = {}
+    for file_path in launch_files:
+        try:
+            text_by_file[file_path] = _read_launch_plan_text(file_path)
+        except (OSError, UnicodeDecodeError) as e:
+            errors_by_file[file_path] = e
+    return text_by_file, errors_by_file
+
+
+def _launch_plan_signature(launch_files_by_project: dict) -> dict:
+    """Map each launch plan path to its [mtime_ns, size] for change detection."""
+    signature = {}
+    for launch_files in launch_files_by_project.values():
+        for file_path in launch_files:
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue
+            signature[str(file_path)] = [stat.st_mtime_ns, stat.st_size]
+    return signature
+
+
+def _load_reschedule_manifest() -> Optional[dict]:
+    """Load the launch plan manifest saved by the last no-op reschedule, if any."""
+    try:
+        return json.loads(RESCHEDULE_MANIFEST_PATH.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+
+
+def _save_reschedule_manifest(manifest: dict) -> None:
+    """Record that the launch plans in the manifest had no undone tasks."""
+    try:
+        RESCHEDULE_MANIFEST_PATH.write_text(json.dumps(manifest), encoding='utf-8')
+    except OSError:
+        pass
+
+
+def _read_launch_plan_text(file_path: Path) -> str:
+    """Read a launch plan's text for the reschedule scans.
+
+    Files with no "**Day N (...)**" header can't contain dated tasks, so they
+    yield an empty string and aren't kept in memory.
+    """
+    content = file_path.read_text(encoding='utf-8')
+    if '**' not in content:
+        return ''
+    return content
+
+
+def _parse_reschedule_date(date_str: str, today=None):
+    """Parse date from day header for reschedule.
+
+    Args:
+        date_str: Date text from a day header, e.g. "Dec 18 - Thu"
+        today: Reference date for picking the year (default: today)
+
+    Returns:
+        Parsed datetime, or None if the text isn't a month/day date
+    """
+    if today is None:
+        today = datetime.now()
+    return _parse_reschedule_date_cached(date_str, today.year, today.month)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_reschedule_date_cached(date_str: str, ref_year: int, ref_month: int):
+    """Parse a day header date relative to a reference year/month (memoized).
+
+    Launch plans repeat the same few dozen header dates across files and
+    across both reschedule scans, so each distinct string is parsed once.
+    """
     # Remove day of week suffix
-    date_str = re.sub(r'\s*-\s*(Mon|Tue|Wed|Thu|Fri|Sat|Sun)\s*$', '', date_str, flags=re.IGNORECASE)
+    date_str = _WEEKDAY_SUFFIX_RE.sub('', date_str)
     date_str = date_str.strip()
 
     # Parse "Dec 1" or "December 1"
-    month_day_match = re.match(
-        r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2})',
-        date_str, re.IGNORECASE
-    )
+    month_day_match = _MONTH_DAY_RE.match(date_str)
 
     if month_day_match:
         month_str = month_day_match.group(1)
         day = int(month_day_match.group(2))
 
-        month_map = {
-            'january': 1, 'jan': 1, 'february': 2, 'feb': 2,
-            'march': 3, 'mar': 3, 'april': 4, 'apr': 4, 'may': 5,
-            'june': 6, 'jun': 6, 'july': 7, 'jul': 7, 'august': 8, 'aug': 8,
-            'september': 9, 'sep': 9, 'october': 10, 'oct': 10,
-            'november': 11, 'nov': 11, 'december': 12, 'dec': 12,
-        }
-
-        month = month_map.get(month_str.lower())
+        month = _MONTH_NUMBERS.get(month_str.lower())
         if month:
-            year = datetime.now().year
-            current_month = datetime.now().month
-            if month < current_month:
+            year = ref_year
+            if month < ref_month:
                 year += 1
             try:
                 return datetime(year, month, day)
@@ -2103,6 +2736,7 @@ def schedule(status: bool, publish_due: bool, upcoming: int, list_posts: bool, a
         ./bip schedule --add "folder" --platforms twitter  # Schedule for Twitter only
     """
     from src.schedulers.post_scheduler import PostScheduler, print_schedule_summary
+    from rich.table import Table
 
     scheduler = PostScheduler()
 
@@ -2198,6 +2832,7 @@ def schedule_all():
     Example: ./bip schedule-all
     """
     from src.schedulers.post_scheduler import PostScheduler
+    from rich.table import Table
 
     scheduler = PostScheduler()
     posts = scheduler.get_all_scheduled_posts()
@@ -2251,6 +2886,7 @@ def schedule_unpublished():
     Example: ./bip schedule-unpublished
     """
     from src.schedulers.post_scheduler import PostScheduler
+    from rich.table import Table
 
     scheduler = PostScheduler()
     posts = scheduler.get_all_unpublished_posts()
@@ -2315,67 +2951,54 @@ def schedule_unpublished():
         console.print("[dim]Run: ./bip schedule --publish-due[/dim]")
 
 
-@cli.command('daily-auto')
-@click.option('--collect-time', default="20:00", help='Time for collect (HH:MM format)')
-@click.option('--select-time', default="20:30", help='Time for select (HH:MM format)')
-@click.option('--skip-publish', is_flag=True, help='Skip auto-publish step')
-def daily_auto(collect_time: str, select_time: str, skip_publish: bool):
-    """Run fully automated 24/7 daily workflow with scheduled times.
+@dataclass
+class _DailyAutoTotals:
+    """Running counts reported by daily-auto's monitoring loop."""
+    temp_processed: int = 0
+    temp_failed: int = 0
+    img_processed: int = 0
+    img_failed: int = 0
+    sched_success: int = 0
+    sched_failed: int = 0
 
-    This command runs the complete daily workflow automatically:
-    - 08:00 AM: Start daily workflow (waits if before 08:00)
-    - meeting: immediately after 08:00
-    - calendar: immediately after meeting
-    - temp-post: immediately after calendar + hourly during wait
-    - collect: at specified time (default 20:00)
-    - generate: immediately after collect
-    - select: at specified time (default 20:30)
-    - publish: immediately after select
-    - 23:00 PM: Reschedule undone tasks + regenerate calendar
-    - Next day 08:00 AM: Restart entire workflow (24/7 loop)
 
-    Example: ./bip daily-auto --collect-time 20:00 --select-time 20:30
-    """
-    console.print(Panel(
-        "[bold]🤖 DAILY-AUTO: Fully Automated 24/7 Build-in-Public Workflow[/bold]\n\n"
-        "This will run the complete workflow automatically in a 24/7 loop:\n"
-        "• 08:00 AM: Start (waits if before 08:00)\n"
-        "• meeting → calendar → temp-post → 🎨images → 📅auto-schedule → (hourly check) → collect → generate → select → 🎨image → publish\n"
-        "• 23:00 PM: Reschedule undone tasks\n"
-        "• Next 08:00 AM: Restart entire workflow\n\n"
-        f"[cyan]Daily start: {settings.daily_start_hour:02d}:00[/cyan]\n"
-        f"[cyan]Collect time: {collect_time}[/cyan]\n"
-        f"[cyan]Select time: {select_time}[/cyan]\n"
-        f"[cyan]Reschedule: {settings.reschedule_hour:02d}:00[/cyan]\n"
-        f"[cyan]Auto-publish: {'No (skipped)' if skip_publish else 'Yes'}[/cyan]\n"
-        f"[cyan]Image generation: Automatic (Gemini Imagen 3)[/cyan]",
-        title="🌅 Daily Auto (24/7)",
-        border_style="green"
-    ))
+def _run_daily_cycle(
+    collect_time: str,
+    select_time: str,
+    publish_scheduler,
+    skip_publish: bool,
+    totals: _DailyAutoTotals,
+    session,
+) -> Tuple[int, Optional[PostRecord]]:
+    """Run one day of the daily-auto workflow (Steps 1-5).
 
-    # Parse times
-    try:
-        collect_hour, collect_min = map(int, collect_time.split(':'))
-        select_hour, select_min = map(int, select_time.split(':'))
-    except ValueError:
-        console.print("[red]❌ Invalid time format. Use HH:MM (e.g., 20:00)[/red]")
-        return
+    meeting → calendar → temp-post → images → auto-schedule → due posts →
+    (wait) collect + generate → (wait) select → image for the selected post
 
-    # Step 0: Wait until 08:00 AM if before
-    if wait_until_morning_start():
-        console.print("[green]✅ Morning start time reached[/green]")
-    else:
-        console.print(f"[yellow]⚠️  Already past {settings.daily_start_hour:02d}:00, starting immediately[/yellow]")
+    Args:
+        collect_time: Collect time as HH:MM (already validated)
+        select_time: Select time as HH:MM (already validated)
+        publish_scheduler: PostScheduler for due posts, or None if publishing is off
+        skip_publish: Whether --skip-publish was given (for the status message)
+        totals: Running counts, updated with this cycle's temp-post results
+        session: Database session shared across daily-auto's cycles
 
-    start_time = datetime.now()
-    console.print(f"\n[bold]🚀 Daily workflow started at {start_time.strftime('%Y-%m-%d %H:%M:%S')}[/bold]\n")
+    Returns:
+        Tuple of (number of posts generated, selected post or None)
+    """
+    from src.collectors.aggregator import DataAggregator
+    from src.generators.post_generator import PostGenerator
+    from src.generators.calendar_generator import CalendarGenerator
+    from src.managers.meeting_manager import MeetingManager
+    from rich.markdown import Markdown
+
+    collect_hour, collect_min = map(int, collect_time.split(':'))
+    select_hour, select_min = map(int, select_time.split(':'))
 
     # ========================================
     # Step 1: Meeting (immediately) - Skip if already generated today
     # ========================================
-    console.print("[bold cyan]" + "=" * 60 + "[/bold cyan]")
-    console.print("[bold cyan]📋 STEP 1: Morning Meeting (immediate)[/bold cyan]")
-    console.print("[bold cyan]" + "=" * 60 + "[/bold cyan]\n")
+    _print_banner("📋 STEP 1: Morning Meeting (immediate)", leading="", trailing="\n")
 
     existing_meeting = check_today_meeting_exists()
     if existing_meeting:
@@ -2393,9 +3016,7 @@ def daily_auto(collect_time: str, select_time: str, skip_publish: bool):
     # ========================================
     # Step 2: Calendar (immediately after meeting)
     # ========================================
-    console.print("\n[bold cyan]" + "=" * 60 + "[/bold cyan]")
-    console.print("[bold cyan]📅 STEP 2: Generate Calendar (immediate)[/bold cyan]")
-    console.print("[bold cyan]" + "=" * 60 + "[/bold cyan]\n")
+    _print_banner("📅 STEP 2: Generate Calendar (immediate)", trailing="\n")
 
     try:
         cal_generator = CalendarGenerator()
@@ -2412,12 +3033,12 @@ def daily_auto(collect_time: str, select_time: str, skip_publish: bool):
     # ========================================
     # Step 2.5: Initial Temp-Post Check (immediately after calendar)
     # ========================================
-    console.print("\n[bold cyan]" + "=" * 60 + "[/bold cyan]")
-    console.print("[bold cyan]📝 STEP 2.5: Initial Temp-Post Check (immediate)[/bold cyan]")
-    console.print("[bold cyan]" + "=" * 60 + "[/bold cyan]\n")
+    _print_banner("📝 STEP 2.5: Initial Temp-Post Check (immediate)", trailing="\n")
 
     try:
         processed, failed = run_temp_post_check()
+        totals.temp_processed += processed
+        totals.temp_failed += failed
         if processed > 0:
             console.print(f"[green]✅ Processed {processed} temp post(s)[/green]")
         else:
@@ -2430,60 +3051,81 @@ def daily_auto(collect_time: str, select_time: str, skip_publish: bool):
     # ========================================
     # Step 2.6: Generate Images for Temp Posts (immediately after temp-post)
     # ========================================
-    console.print("\n[bold cyan]" + "=" * 60 + "[/bold cyan]")
-    console.print("[bold cyan]🎨 STEP 2.6: Generate Images for Posts (immediate)[/bold cyan]")
-    console.print("[bold cyan]" + "=" * 60 + "[/bold cyan]\n")
-
+    # Only runs when a post still needs images: new posts from 2.5, or posts
+    # a previous run left behind. The scan is handed to the step so the
+    # directories aren't walked twice
     try:
-        img_processed, img_failed, img_skipped = run_image_generation()
-        if img_processed > 0:
-            console.print(f"[green]✅ Generated images for {img_processed} post(s)[/green]")
-        else:
-            console.print(f"[cyan]ℹ️  No new images to generate[/cyan]")
-        if img_failed > 0:
-            console.print(f"[yellow]⚠️  {img_failed} image generation(s) failed[/yellow]")
+        pending_images = _get_image_generator().find_unprocessed_posts()
     except Exception as e:
-        console.print(f"[red]❌ Image generation failed: {e}[/red]")
+        console.print(f"[red]❌ Image check failed: {e}[/red]")
+        pending_images = None
+
+    if pending_images:
+        _print_banner("🎨 STEP 2.6: Generate Images for Posts (immediate)", trailing="\n")
+
+        try:
+            img_processed, img_failed, img_skipped = run_image_generation(pending=pending_images)
+            totals.img_processed += img_processed
+            totals.img_failed += img_failed
+            if img_processed > 0:
+                console.print(f"[green]✅ Generated images for {img_processed} post(s)[/green]")
+            else:
+                console.print(f"[cyan]ℹ️  No new images to generate[/cyan]")
+            if img_failed > 0:
+                console.print(f"[yellow]⚠️  {img_failed} image generation(s) failed[/yellow]")
+        except Exception as e:
+            console.print(f"[red]❌ Image generation failed: {e}[/red]")
+    elif pending_images is not None:
+        console.print("\n[cyan]ℹ️  No posts need images, skipping step 2.6[/cyan]")
 
     # ========================================
     # Step 2.7: Auto-schedule temp posts (immediate after images)
     # ========================================
-    console.print("\n[bold cyan]" + "=" * 60 + "[/bold cyan]")
-    console.print("[bold cyan]📅 STEP 2.7: Auto-Schedule Temp Posts (immediate)[/bold cyan]")
-    console.print("[bold cyan]" + "=" * 60 + "[/bold cyan]\n")
-
+    # Only runs when a temp post has images but no post record yet
     try:
-        sched_success, sched_failed = auto_schedule_temp_posts()
-        if sched_success > 0:
-            console.print(f"[green]✅ Scheduled {sched_success} temp post(s) for publishing[/green]")
-        else:
-            console.print(f"[cyan]ℹ️  No temp posts to schedule[/cyan]")
-        if sched_failed > 0:
-            console.print(f"[yellow]⚠️  {sched_failed} scheduling(s) failed[/yellow]")
+        schedulable = list_schedulable_temp_posts()
     except Exception as e:
-        console.print(f"[red]❌ Auto-scheduling failed: {e}[/red]")
+        console.print(f"[red]❌ Scheduling check failed: {e}[/red]")
+        schedulable = []
+
+    if schedulable:
+        _print_banner("📅 STEP 2.7: Auto-Schedule Temp Posts (immediate)", trailing="\n")
+
+        try:
+            sched_success, sched_failed = auto_schedule_temp_posts(schedulable=schedulable)
+            totals.sched_success += sched_success
+            totals.sched_failed += sched_failed
+            if sched_success > 0:
+                console.print(f"[green]✅ Scheduled {sched_success} temp post(s) for publishing[/green]")
+            else:
+                console.print(f"[cyan]ℹ️  No temp posts to schedule[/cyan]")
+            if sched_failed > 0:
+                console.print(f"[yellow]⚠️  {sched_failed} scheduling(s) failed[/yellow]")
+        except Exception as e:
+            console.print(f"[red]❌ Auto-scheduling failed: {e}[/red]")
+    else:
+        console.print("\n[cyan]ℹ️  No temp posts to schedule, skipping step 2.7[/cyan]")
 
     # ========================================
     # Step 2.8: Publish Due Posts (immediate check before wait)
     # ========================================
-    console.print("\n[bold cyan]" + "=" * 60 + "[/bold cyan]")
-    console.print("[bold cyan]📤 STEP 2.8: Publish Due Posts (immediate)[/bold cyan]")
-    console.print("[bold cyan]" + "=" * 60 + "[/bold cyan]\n")
+    _print_banner("📤 STEP 2.8: Publish Due Posts (immediate)", trailing="\n")
 
     # Check if publishing is disabled (via flag or config)
-    if skip_publish or not settings.auto_post_enabled:
+    if publish_scheduler is None:
         console.print(f"[yellow]⏭️  Auto-publish disabled (skip_publish={skip_publish}, auto_post_enabled={settings.auto_post_enabled})[/yellow]")
         console.print("[cyan]ℹ️  Posts are saved and scheduled, but not published automatically[/cyan]")
         console.print("[dim]   To publish manually: ./bip schedule --publish-due[/dim]")
     else:
         try:
-            from src.schedulers.post_scheduler import PostScheduler
-            scheduler = PostScheduler()
-            due_posts = scheduler.get_due_posts()
+            # Posts may have been scheduled (e.g. by step 2.7) or edited by
+            # other sessions since the last check, so don't trust cached rows
+            publish_scheduler.session.expire_all()
+            due_posts = publish_scheduler.get_due_posts()
 
             if due_posts:
                 console.print(f"[bold yellow]📤 {len(due_posts)} scheduled post(s) due for publishing...[/bold yellow]")
-                published, failed = scheduler.process_due_posts()
+                published, failed = publish_scheduler.process_due_posts(due_posts)
                 if published > 0:
                     console.print(f"[green]✅ Published {published} scheduled post(s)[/green]")
                 if failed > 0:
@@ -2496,9 +3138,7 @@ def daily_auto(collect_time: str, select_time: str, skip_publish: bool):
     # ========================================
     # Step 3: Wait until collect time (with hourly temp-post checks), then collect + generate
     # ========================================
-    console.print("\n[bold cyan]" + "=" * 60 + "[/bold cyan]")
-    console.print(f"[bold cyan]📦 STEP 3: Collect Data (at {collect_time})[/bold cyan]")
-    console.print("[bold cyan]" + "=" * 60 + "[/bold cyan]")
+    _print_banner(f"📦 STEP 3: Collect Data (at {collect_time})")
 
     # Check if collect time has passed
     now = datetime.now()
@@ -2523,43 +3163,29 @@ def daily_auto(collect_time: str, select_time: str, skip_publish: bool):
     generator = PostGenerator()
     posts = generator.generate_multiple_posts(data, count=settings.posts_per_day)
 
-    # Save posts to database
-    session = get_session()
-    saved_records = []
-    for post in posts:
-        record = PostRecord(
-            generation_date=datetime.now(),
-            content=post.content,
-            style=post.style.value,
-            language=post.language.value,
-            hashtags=post.hashtags,
-            word_count=post.word_count,
-            projects_mentioned=post.projects_mentioned,
-            technical_keywords=post.technical_keywords,
-            source_data=data.model_dump(mode='json'),
-            generation_metadata=post.metadata,
-            status=PostStatus.DRAFT.value,
-        )
-        session.add(record)
-        saved_records.append(record)
-    session.commit()
+    # Save posts to database in one transaction. The records' ids are needed
+    # for the markdown export, so keep them in the session; the source data
+    # is serialized once for the batch
+    now = datetime.now()
+    source_data = data.model_dump(mode='json')
+    saved_records = [PostRecord.from_generated(post, source_data, now) for post in posts]
+    session.add_all(saved_records)
+    try:
+        session.commit()
+    except Exception:
+        # Leave the long-lived session usable for the next cycle
+        session.rollback()
+        raise
     console.print(f"[green]✅ Generated and saved {len(posts)} posts to database[/green]")
 
     # Auto-save ALL posts to selected_posts directory
     console.print(f"\n[bold]📁 Auto-saving all {len(saved_records)} posts to selected_posts/...[/bold]")
-    for record in saved_records:
-        try:
-            filepath = save_post_to_markdown(record)
-            console.print(f"   ✅ Saved: {filepath.name}")
-        except Exception as e:
-            console.print(f"   [yellow]⚠️  Failed to save post #{record.id}: {e}[/yellow]")
+    _save_posts_to_markdown(saved_records, now=now)
 
     # ========================================
     # Step 4: Wait until select time, then select + publish
     # ========================================
-    console.print("\n[bold cyan]" + "=" * 60 + "[/bold cyan]")
-    console.print(f"[bold cyan]👆 STEP 4: Auto-Select Post (at {select_time})[/bold cyan]")
-    console.print("[bold cyan]" + "=" * 60 + "[/bold cyan]")
+    _print_banner(f"👆 STEP 4: Auto-Select Post (at {select_time})")
 
     # Check if select time has passed
     now = datetime.now()
@@ -2577,43 +3203,36 @@ def daily_auto(collect_time: str, select_time: str, skip_publish: bool):
     # Step 4.5: Generate Image for Selected Post (immediate)
     # ========================================
     if selected_post:
-        console.print("\n[bold cyan]" + "=" * 60 + "[/bold cyan]")
-        console.print("[bold cyan]🎨 STEP 4.5: Generate Image for Selected Post[/bold cyan]")
-        console.print("[bold cyan]" + "=" * 60 + "[/bold cyan]\n")
+        _print_banner("🎨 STEP 4.5: Generate Image for Selected Post", trailing="\n")
 
         try:
-            # Get the post filename from the most recently saved selected post
-            selected_posts_dir = Path("data/selected_posts")
-            # Find the image-prompt file for this post
-            image_prompt_pattern = f"image-prompt_*_id{selected_post.id}.md"
-            image_prompt_files = list(selected_posts_dir.glob(image_prompt_pattern))
-
-            if image_prompt_files:
-                image_prompt_file = image_prompt_files[0]
+            # Find the image-prompt file for the most recently saved selected post
+            image_prompt_file = _find_image_prompt_file(SELECTED_POSTS_DIR, selected_post.id)
+
+            if image_prompt_file:
                 post_name = image_prompt_file.stem.replace("image-prompt_", "")
 
                 # Generate image for this specific post
-                generator = ImageGenerator()
-                images_folder = Path("data/post-images") / post_name
+                generator = _get_image_generator()
+                images_folder = POST_IMAGES_DIR / post_name
                 images_marker = images_folder / "images.ready"
 
                 if not images_marker.exists():
                     console.print(f"  🎨 Generating image for: {post_name}")
 
-                    # Read prompts from image-prompt file
-                    with open(image_prompt_file, 'r', encoding='utf-8') as f:
-                        prompt_content = f.read()
+                    # Read prompts from image-prompt file (one post's prompts, so it
+                    # stays small; a stray bad byte shouldn't abort image generation)
+                    prompt_content = image_prompt_file.read_text(encoding='utf-8', errors='replace')
 
                     prompts = generator.extract_image_prompts_from_post(prompt_content, post_name)
 
                     if prompts:
                         width, height = 1080, 1440  # Xiaohongshu dimensions
-                        for prompt_info in prompts:
-                            image_name = prompt_info["name"].lower().replace(" ", "_")
-                            import re
-                            image_name = re.sub(r'[^a-z0-9_]', '', image_name)
 
-                            result = generator.generate_image(
+                        def generate_prompt_image(prompt_info):
+                            image_name = prompt_info["name"].lower().replace(" ", "_")
+                            image_name = _IMAGE_NAME_INVALID_RE.sub('', image_name)
+                            return generator.generate_image(
                                 prompt=prompt_info["prompt"],
                                 output_path=images_folder,
                                 image_name=image_name,
@@ -2622,12 +3241,23 @@ def daily_auto(collect_time: str, select_time: str, skip_publish: bool):
                                 platform="xiaohongshu"
                             )
 
+                        # Each prompt is an independent remote API call, so request
+                        # them concurrently; results are reported in prompt order
+                        with ThreadPoolExecutor(max_workers=min(4, len(prompts))) as executor:
+                            results = list(executor.map(generate_prompt_image, prompts))
+
+                        any_saved = False
+                        for result in results:
                             if result.get("success"):
                                 console.print(f"  ✅ Image saved: {result['file_path']}")
-                                images_marker.parent.mkdir(parents=True, exist_ok=True)
-                                images_marker.touch()
+                                any_saved = True
                             else:
                                 console.print(f"  ❌ Image generation failed: {result.get('error')}")
+
+                        # generate_image() creates the folder when it saves an
+                        # image, so it already exists here
+                        if any_saved:
+                            images_marker.touch()
                     else:
                         console.print(f"  ⚠️  No image prompts found")
                 else:
@@ -2644,19 +3274,89 @@ def daily_auto(collect_time: str, select_time: str, skip_publish: bool):
     # Selected posts stay as SELECTED status for manual review and posting.
     # Use ./bip schedule --add to schedule temp posts for auto-publishing.
     if selected_post:
-        console.print("\n[bold cyan]" + "=" * 60 + "[/bold cyan]")
-        console.print("[bold cyan]📋 STEP 5: Selected Post Ready for Review[/bold cyan]")
-        console.print("[bold cyan]" + "=" * 60 + "[/bold cyan]")
+        _print_banner("📋 STEP 5: Selected Post Ready for Review")
         console.print(f"\n[green]✅ Post #{selected_post.id} is ready for manual review[/green]")
         console.print("[dim]   Selected posts are NOT auto-published.[/dim]")
         console.print("[dim]   Review in data/selected_posts/ and post manually.[/dim]")
 
+    return len(posts), selected_post
+
+
+@cli.command('daily-auto')
+@click.option('--collect-time', default="20:00", help='Time for collect (HH:MM format)')
+@click.option('--select-time', default="20:30", help='Time for select (HH:MM format)')
+@click.option('--skip-publish', is_flag=True, help='Skip auto-publish step')
+def daily_auto(collect_time: str, select_time: str, skip_publish: bool):
+    """Run fully automated 24/7 daily workflow with scheduled times.
+
+    This command runs the complete daily workflow automatically:
+    - 08:00 AM: Start daily workflow (waits if before 08:00)
+    - meeting: immediately after 08:00
+    - calendar: immediately after meeting
+    - temp-post: immediately after calendar + hourly during wait
+    - collect: at specified time (default 20:00)
+    - generate: immediately after collect
+    - select: at specified time (default 20:30)
+    - publish: immediately after select
+    - 23:00 PM: Reschedule undone tasks + regenerate calendar
+    - Next day 08:00 AM: Restart entire workflow (24/7 loop)
+
+    Example: ./bip daily-auto --collect-time 20:00 --select-time 20:30
+    """
+    from src.schedulers.post_scheduler import PostScheduler
+    from rich.panel import Panel
+
+    # Decided once for the whole session
+    auto_publish = not skip_publish and settings.auto_post_enabled
+
+    console.print(Panel(
+        "[bold]🤖 DAILY-AUTO: Fully Automated 24/7 Build-in-Public Workflow[/bold]\n\n"
+        "This will run the complete workflow automatically in a 24/7 loop:\n"
+        "• 08:00 AM: Start (waits if before 08:00)\n"
+        "• meeting → calendar → temp-post → 🎨images → 📅auto-schedule → (hourly check) → collect → generate → select → 🎨image → publish\n"
+        "• 23:00 PM: Reschedule undone tasks\n"
+        "• Next 08:00 AM: Restart entire workflow\n\n"
+        f"[cyan]Daily start: {settings.daily_start_hour:02d}:00[/cyan]\n"
+        f"[cyan]Collect time: {collect_time}[/cyan]\n"
+        f"[cyan]Select time: {select_time}[/cyan]\n"
+        f"[cyan]Reschedule: {settings.reschedule_hour:02d}:00[/cyan]\n"
+        f"[cyan]Auto-publish: {'Yes' if auto_publish else 'No (skipped)' if skip_publish else 'No (disabled in settings)'}[/cyan]\n"
+        f"[cyan]Image generation: Automatic (Gemini Imagen 3)[/cyan]",
+        title="🌅 Daily Auto (24/7)",
+        border_style="green"
+    ))
+
+    # Validate times (each daily cycle parses them)
+    try:
+        for hh_mm in (collect_time, select_time):
+            hour, minute = map(int, hh_mm.split(':'))
+    except ValueError:
+        console.print("[red]❌ Invalid time format. Use HH:MM (e.g., 20:00)[/red]")
+        return
+
+    # One scheduler for every due-post check in this long-running loop
+    publish_scheduler = PostScheduler() if auto_publish else None
+    # One session for saving each cycle's generated posts
+    session = get_session()
+
+    # Step 0: Wait until 08:00 AM if before
+    if wait_until_morning_start():
+        console.print("[green]✅ Morning start time reached[/green]")
+    else:
+        console.print(f"[yellow]⚠️  Already past {settings.daily_start_hour:02d}:00, starting immediately[/yellow]")
+
+    start_time = datetime.now()
+    console.print(f"\n[bold]🚀 Daily workflow started at {start_time.strftime('%Y-%m-%d %H:%M:%S')}[/bold]\n")
+
+    totals = _DailyAutoTotals()
+    post_count, selected_post = _run_daily_cycle(
+        collect_time, select_time, publish_scheduler, skip_publish, totals, session
+    )
+
     # ========================================
     # Step 6: Continuous Temp-Post Monitoring
     # ========================================
-    console.print("\n[bold cyan]" + "=" * 60 + "[/bold cyan]")
-    console.print("[bold cyan]🔄 STEP 6: Continuous Temp-Post Monitoring[/bold cyan]")
-    console.print("[bold cyan]" + "=" * 60 + "[/bold cyan]")
+    _print_banner("🔄 STEP 6: Continuous Temp-Post Monitoring")
 
     console.print("\n[bold yellow]📝 Now monitoring for new temp posts...[/bold yellow]")
     console.print("   Checking every hour for new folders in data/temp_posts/")
@@ -2672,7 +3372,7 @@ def daily_auto(collect_time: str, select_time: str, skip_publish: bool):
     console.print(f"   Started: {start_time.strftime('%H:%M:%S')}")
     console.print(f"   Workflow completed: {workflow_end_time.strftime('%H:%M:%S')}")
     console.print(f"   Duration: {workflow_duration}")
-    console.print(f"   Posts generated: {len(posts)}")
+    console.print(f"   Posts generated: {post_count}")
     if selected_post:
         console.print(f"   Selected post: #{selected_post.id}")
         if selected_post.xhs_url:
@@ -2680,12 +3380,6 @@ def daily_auto(collect_time: str, select_time: str, skip_publish: bool):
     console.print("=" * 60)
 
     # Continuous monitoring loop with 23:00 reschedule and 08:00 next day restart
-    total_temp_processed = 0
-    total_temp_failed = 0
-    total_img_processed = 0
-    total_img_failed = 0
-    total_sched_success = 0
-    total_sched_failed = 0
     check_count = 0
     reschedule_done_today = False
     day_count = 1
@@ -2693,14 +3387,16 @@ def daily_auto(collect_time: str, select_time: str, skip_publish: bool):
     try:
         while True:
             check_count += 1
+            # One clock read drives this iteration's time-of-day checks
             current_time = datetime.now()
+            current_hour = current_time.hour
 
             console.print(f"\n[dim]─── Hourly Check #{check_count} ({current_time.strftime('%H:%M:%S')}) ───[/dim]")
 
             # Check for new temp posts
             processed, failed = run_temp_post_check()
-            total_temp_processed += processed
-            total_temp_failed += failed
+            totals.temp_processed += processed
+            totals.temp_failed += failed
 
             if processed > 0:
                 console.print(f"[green]   ✅ Processed {processed} new temp post(s)[/green]")
@@ -2708,33 +3404,34 @@ def daily_auto(collect_time: str, select_time: str, skip_publish: bool):
                 # Generate images for newly processed posts
                 console.print(f"[cyan]   🎨 Generating images for new posts...[/cyan]")
                 img_proc, img_fail, _ = run_image_generation()
-                total_img_processed += img_proc
-                total_img_failed += img_fail
+                totals.img_processed += img_proc
+                totals.img_failed += img_fail
                 if img_proc > 0:
                     console.print(f"[green]   ✅ Generated images for {img_proc} post(s)[/green]")
 
                 # Auto-schedule posts that now have images
                 console.print(f"[cyan]   📅 Auto-scheduling posts...[/cyan]")
                 sched_ok, sched_fail = auto_schedule_temp_posts()
-                total_sched_success += sched_ok
-                total_sched_failed += sched_fail
+                totals.sched_success += sched_ok
+                totals.sched_failed += sched_fail
                 if sched_ok > 0:
                     console.print(f"[green]   ✅ Scheduled {sched_ok} post(s) for publishing[/green]")
             else:
                 console.print(f"[dim]   No new temp posts[/dim]")
 
-            console.print(f"[dim]   Posts: {total_temp_processed} | Images: {total_img_processed} | Scheduled: {total_sched_success} | Failed: {total_temp_failed + total_img_failed + total_sched_failed}[/dim]")
+            console.print(f"[dim]   Posts: {totals.temp_processed} | Images: {totals.img_processed} | Scheduled: {totals.sched_success} | Failed: {totals.temp_failed + totals.img_failed + totals.sched_failed}[/dim]")
 
             # Check for scheduled posts that are due for publishing (if auto-publish enabled)
-            if not skip_publish and settings.auto_post_enabled:
+            if publish_scheduler is not None:
                 try:
-                    from src.schedulers.post_scheduler import PostScheduler
-                    scheduler = PostScheduler()
-                    due_posts = scheduler.get_due_posts()
+                    # Posts may have been scheduled or edited by other sessions
+                    # since the last check, so don't trust cached rows
+                    publish_scheduler.session.expire_all()
+                    due_posts = publish_scheduler.get_due_posts()
 
                     if due_posts:
                         console.print(f"\n[bold yellow]📤 {len(due_posts)} scheduled post(s) due for publishing...[/bold yellow]")
-                        published, failed = scheduler.process_due_posts()
+                        published, failed = publish_scheduler.process_due_posts(due_posts)
                         if published > 0:
                             console.print(f"[green]   ✅ Published {published} scheduled post(s)[/green]")
                         if failed > 0:
@@ -2744,182 +3441,42 @@ def daily_auto(collect_time: str, select_time: str, skip_publish: bool):
 
             # Check if it's 23:00 or later - time for reschedule procedure
             # We check >= settings.reschedule_hour to catch cases where hourly check happens after 23:00
-            if current_time.hour >= settings.reschedule_hour and not reschedule_done_today:
+            if current_hour >= settings.reschedule_hour and not reschedule_done_today:
                 console.print(f"\n[bold magenta]⏰ {current_time.strftime('%H:%M')} - Running end-of-day reschedule...[/bold magenta]")
                 undone_count, cal_path = run_reschedule_procedure()
                 reschedule_done_today = True
                 console.print(f"[green]✅ Reschedule complete. Undone tasks: {undone_count}[/green]")
 
             # Check if it's past midnight and before 08:00 - wait for next day start
-            if current_time.hour < settings.daily_start_hour:
+            if current_hour < settings.daily_start_hour:
                 console.print(f"\n[bold cyan]🌙 Past midnight. Waiting for {settings.daily_start_hour:02d}:00 to start new daily cycle...[/bold cyan]")
 
                 # Wait until 08:00
                 target_morning = current_time.replace(hour=settings.daily_start_hour, minute=0, second=0, microsecond=0)
-                while datetime.now() < target_morning:
-                    time.sleep(60)
+                _sleep_until(target_morning)
 
                 # New day - restart the workflow
                 day_count += 1
                 reschedule_done_today = False
-                console.print(f"\n[bold cyan]{'=' * 60}[/bold cyan]")
-                console.print(f"[bold cyan]🌅 NEW DAILY CYCLE #{day_count} - {datetime.now().strftime('%Y-%m-%d')}[/bold cyan]")
-                console.print(f"[bold cyan]{'=' * 60}[/bold cyan]")
+                start_time = datetime.now()
+                _print_banner(f"🌅 NEW DAILY CYCLE #{day_count} - {start_time.strftime('%Y-%m-%d')}")
 
                 # Run the full daily workflow again
-                start_time = datetime.now()
                 console.print(f"\n[bold]🚀 Daily workflow restarted at {start_time.strftime('%H:%M:%S')}[/bold]\n")
 
-                # Step 1: Meeting
-                console.print("[bold cyan]📋 STEP 1: Morning Meeting[/bold cyan]")
-                try:
-                    manager = MeetingManager()
-                    report, text, filepath = manager.run_meeting()
-                    console.print(f"[green]✅ Meeting complete. Report: {filepath}[/green]")
-                except Exception as e:
-                    console.print(f"[red]❌ Meeting failed: {e}[/red]")
-
-                # Step 2: Calendar
-                console.print("\n[bold cyan]📅 STEP 2: Generate Calendar[/bold cyan]")
-                try:
-                    cal_generator = CalendarGenerator()
-                    output_file = cal_generator.generate_calendar()
-                    if output_file:
-                        console.print(f"[green]✅ Calendar generated: {output_file}[/green]")
-                        # Upload to configured destinations
-                        upload_calendar(output_file, show_header=False)
-                except Exception as e:
-                    console.print(f"[red]❌ Calendar failed: {e}[/red]")
-
-                # Step 2.5: Temp-Post Check
-                console.print("\n[bold cyan]📝 STEP 2.5: Temp-Post Check[/bold cyan]")
-                try:
-                    p, f = run_temp_post_check()
-                    total_temp_processed += p
-                    total_temp_failed += f
-                    console.print(f"[green]✅ Processed {p} temp post(s)[/green]")
-                except Exception as e:
-                    console.print(f"[red]❌ Temp-post check failed: {e}[/red]")
-
-                # Step 2.6: Image Generation
-                console.print("\n[bold cyan]🎨 STEP 2.6: Generate Images[/bold cyan]")
-                try:
-                    ip, if_, _ = run_image_generation()
-                    total_img_processed += ip
-                    total_img_failed += if_
-                    console.print(f"[green]✅ Generated images for {ip} post(s)[/green]")
-                except Exception as e:
-                    console.print(f"[red]❌ Image generation failed: {e}[/red]")
-
-                # Step 3: Wait for collect time
-                console.print(f"\n[bold cyan]📦 STEP 3: Waiting for collect time ({collect_time})[/bold cyan]")
-                now = datetime.now()
-                target_collect = now.replace(hour=collect_hour, minute=collect_min, second=0, microsecond=0)
-                if now < target_collect:
-                    wait_until_time_with_hourly_check(collect_hour, collect_min)
-
-                # Collect and generate
-                console.print("\n[bold]📦 Collecting data...[/bold]")
-                aggregator = DataAggregator()
-                data = aggregator.collect_all_data()
-
-                console.print(f"\n[bold]✨ Generating {settings.posts_per_day} posts...[/bold]")
-                generator = PostGenerator()
-                posts = generator.generate_multiple_posts(data, count=settings.posts_per_day)
-
-                session = get_session()
-                saved_records = []
-                for post in posts:
-                    record = PostRecord(
-                        generation_date=datetime.now(),
-                        content=post.content,
-                        style=post.style.value,
-                        language=post.language.value,
-                        hashtags=post.hashtags,
-                        word_count=post.word_count,
-                        projects_mentioned=post.projects_mentioned,
-                        technical_keywords=post.technical_keywords,
-                        source_data=data.model_dump(mode='json'),
-                        generation_metadata=post.metadata,
-                        status=PostStatus.DRAFT.value,
-                    )
-                    session.add(record)
-                    saved_records.append(record)
-                session.commit()
-                console.print(f"[green]✅ Generated and saved {len(posts)} posts to database[/green]")
-
-                # Auto-save ALL posts to selected_posts directory
-                console.print(f"\n[bold]📁 Auto-saving all {len(saved_records)} posts to selected_posts/...[/bold]")
-                for record in saved_records:
-                    try:
-                        filepath = save_post_to_markdown(record)
-                        console.print(f"   ✅ Saved: {filepath.name}")
-                    except Exception as e:
-                        console.print(f"   [yellow]⚠️  Failed to save post #{record.id}: {e}[/yellow]")
-
-                # Step 4: Wait for select time
-                console.print(f"\n[bold cyan]👆 STEP 4: Waiting for select time ({select_time})[/bold cyan]")
-                now = datetime.now()
-                target_select = now.replace(hour=select_hour, minute=select_min, second=0, microsecond=0)
-                if now < target_select:
-                    wait_until_time(select_hour, select_min)
-
-                selected_post = auto_select_post()
-
-                # Step 4.5: Generate Image for Selected Post
-                if selected_post:
-                    console.print("\n[bold cyan]🎨 STEP 4.5: Generate Image for Selected Post[/bold cyan]")
-                    try:
-                        selected_posts_dir = Path("data/selected_posts")
-                        image_prompt_pattern = f"image-prompt_*_id{selected_post.id}.md"
-                        image_prompt_files = list(selected_posts_dir.glob(image_prompt_pattern))
-
-                        if image_prompt_files:
-                            image_prompt_file = image_prompt_files[0]
-                            post_name = image_prompt_file.stem.replace("image-prompt_", "")
-                            generator = ImageGenerator()
-                            images_folder = Path("data/post-images") / post_name
-                            images_marker = images_folder / "images.ready"
-
-                            if not images_marker.exists():
-                                with open(image_prompt_file, 'r', encoding='utf-8') as f:
-                                    prompt_content = f.read()
-                                prompts = generator.extract_image_prompts_from_post(prompt_content, post_name)
-                                if prompts:
-                                    for prompt_info in prompts:
-                                        image_name = prompt_info["name"].lower().replace(" ", "_")
-                                        import re
-                                        image_name = re.sub(r'[^a-z0-9_]', '', image_name)
-                                        result = generator.generate_image(
-                                            prompt=prompt_info["prompt"],
-                                            output_path=images_folder,
-                                            image_name=image_name,
-                                            width=1080, height=1440,
-                                            platform="xiaohongshu"
-                                        )
-                                        if result.get("success"):
-                                            console.print(f"  ✅ Image saved: {result['file_path']}")
-                                            images_marker.parent.mkdir(parents=True, exist_ok=True)
-                                            images_marker.touch()
-                    except Exception as e:
-                        console.print(f"  [red]❌ Image generation failed: {e}[/red]")
-
-                # Step 5: Selected Post Ready for Manual Review
-                # NOTE: Auto-publish for selected posts removed (Task 62)
-                if selected_post:
-                    console.print("\n[bold cyan]📋 STEP 5: Selected Post Ready for Review[/bold cyan]")
-                    console.print(f"[green]✅ Post #{selected_post.id} ready for manual review[/green]")
+                _run_daily_cycle(collect_time, select_time, publish_scheduler, skip_publish, totals, session)
 
                 console.print("\n[bold green]✨ Daily workflow complete! Continuing monitoring...[/bold green]")
                 continue
 
-            console.print(f"[dim]   Next check in 1 hour... (Ctrl+C to exit)[/dim]")
-
-            # Wait for 1 hour
-            time.sleep(3600)
+            # Wait for the top of the next hour, so checks don't drift later each cycle
+            next_check = datetime.now().replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+            console.print(f"[dim]   Next check at {next_check.strftime('%H:%M')}... (Ctrl+C to exit)[/dim]")
+            _sleep_until(next_check)
 
     except KeyboardInterrupt:
         # User pressed Ctrl+C
+        session.close()
         console.print("\n\n" + "=" * 60)
         console.print("[bold yellow]🛑 MONITORING STOPPED BY USER[/bold yellow]")
         console.print("=" * 60)
@@ -2931,8 +3488,8 @@ def daily_auto(collect_time: str, select_time: str, skip_publish: bool):
         console.print(f"   Total runtime: {total_duration}")
         console.print(f"   Daily cycles completed: {day_count}")
         console.print(f"   Hourly checks performed: {check_count}")
-        console.print(f"   Temp posts processed: {total_temp_processed}")
-        console.print(f"   Temp posts failed: {total_temp_failed}")
+        console.print(f"   Temp posts processed: {totals.temp_processed}")
+        console.print(f"   Temp posts failed: {totals.temp_failed}")
         console.print(f"\n[bold green]✨ DAILY-AUTO SESSION ENDED[/bold green]")
 
 
@@ -1,5 +1,6 @@
 """Data aggregator - combines all collected data."""
 
+import functools
 from datetime import datetime
 from typing import Dict, List
 from src.models import PostData, GitCommit, ClaudeConversation
@@ -8,6 +9,28 @@ from src.collectors.claude_collector import ClaudeCollector
 from src.config import settings
 
 
+def _blank_project(name: str, config: dict) -> dict:
+    """Create an empty per-project entry for _organize_by_project.
+
+    Args:
+        name: Project name
+        config: Project config from settings (empty for unconfigured projects)
+
+    Returns:
+        Project entry with no activity
+    """
+    return {
+        "name": name,
+        "type": config.get('type', 'unknown'),
+        "description": config.get('description', ''),
+        "commits": [],
+        "conversations": [],
+        "topics": {},  # Used as an ordered set
+        "commit_count": 0,
+        "has_activity": False,
+    }
+
+
 class DataAggregator:
     """Aggregate data from all collectors."""
 
@@ -56,6 +79,11 @@ class DataAggregator:
 
         return post_data
 
+    @functools.cached_property
+    def _project_configs(self) -> Dict[str, dict]:
+        """Project configs by name (settings.all_projects is rebuilt on every access)."""
+        return {p['name']: p for p in settings.all_projects}
+
     def _organize_by_project(
         self,
         git_commits: List[GitCommit],
@@ -70,63 +98,35 @@ class DataAggregator:
         Returns:
             Dictionary organized by project name
         """
-        project_data = {}
-
-        # Get project configs from settings (loaded from .env)
-        project_configs = {p['name']: p for p in settings.all_projects}
-
         # Initialize all configured projects (even if no activity)
-        for project_name, config in project_configs.items():
-            project_data[project_name] = {
-                "name": project_name,
-                "type": config.get('type', 'unknown'),
-                "description": config.get('description', ''),
-                "commits": [],
-                "conversations": [],
-                "topics": set(),
-                "commit_count": 0,
-                "has_activity": False,
-            }
+        project_data = {
+            name: _blank_project(name, config)
+            for name, config in self._project_configs.items()
+        }
 
         # Organize commits by project
         for commit in git_commits:
-            if commit.project not in project_data:
+            entry = project_data.get(commit.project)
+            if entry is None:
                 # Handle projects not in config
-                project_data[commit.project] = {
-                    "name": commit.project,
-                    "type": 'unknown',
-                    "description": '',
-                    "commits": [],
-                    "conversations": [],
-                    "topics": set(),
-                    "commit_count": 0,
-                    "has_activity": False,
-                }
-
-            project_data[commit.project]["commits"].append(commit)
-            project_data[commit.project]["commit_count"] += 1
-            project_data[commit.project]["has_activity"] = True
+                entry = project_data[commit.project] = _blank_project(commit.project, {})
+
+            entry["commits"].append(commit)
+            entry["commit_count"] += 1
+            entry["has_activity"] = True
 
         # Organize conversations by project
         for conv in claude_conversations:
-            if conv.project not in project_data:
+            entry = project_data.get(conv.project)
+            if entry is None:
                 # Handle projects not in config
-                project_data[conv.project] = {
-                    "name": conv.project,
-                    "type": 'unknown',
-                    "description": '',
-                    "commits": [],
-                    "conversations": [],
-                    "topics": set(),
-                    "commit_count": 0,
-                    "has_activity": False,
-                }
-
-            project_data[conv.project]["conversations"].append(conv)
-            project_data[conv.project]["topics"].update(conv.key_topics)
-            project_data[conv.project]["has_activity"] = True
-
-        # Convert topics set to list
+                entry = project_data[conv.project] = _blank_project(conv.project, {})
+
+            entry["conversations"].append(conv)
+            entry["topics"].update(dict.fromkeys(conv.key_topics))
+            entry["has_activity"] = True
+
+        # Convert topics to a list (in first-seen order)
         for project in project_data.values():
             project["topics"] = list(project["topics"])
 
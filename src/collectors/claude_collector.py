@@ -1,15 +1,57 @@
 """Claude Code conversation collector."""
 
+import functools
 import json
 import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 import re
 
+from src.collectors.keyword_matcher import TechKeywordMatcher
 from src.models import ClaudeConversation
 from src.config import settings, bip_settings
 
+# orjson is optional - used for faster JSONL session parsing when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+# Messages kept per conversation for context, and the cap on extracted
+# user questions / technical details per session
+CONTEXT_MESSAGES = 20
+MAX_EXTRACTED_ITEMS = 5
+
+
+# Windows drive prefix (e.g. "C:\\"), converted to a WSL /mnt/ path
+_WINDOWS_DRIVE_RE = re.compile(r'^[A-Za-z]:\\')
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_project_path(base_dir: str, project_path: str) -> Path:
+    """Resolve a project's absolute path (cached; resolve() hits the filesystem).
+
+    Args:
+        base_dir: Base directory projects are relative to
+        project_path: Path to project
+
+    Returns:
+        Resolved absolute project path
+    """
+    return (Path(base_dir) / project_path).resolve()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_tech_matcher() -> TechKeywordMatcher:
+    """Build the tech keyword matcher from config once per process."""
+    return TechKeywordMatcher(bip_settings.tech_keywords)
+
 
 class ClaudeCollector:
     """Collect Claude Code conversation history."""
@@ -37,6 +79,9 @@ class ClaudeCollector:
                 self.central_claude_dir = dir_path
                 break
 
+        # Tech keyword matcher (from config), shared by every collector
+        self._tech_matcher = _get_tech_matcher()
+
     def _get_project_claude_dir(self, project_path: str) -> Path:
         """Get .claude directory for a project.
 
@@ -48,7 +93,7 @@ class ClaudeCollector:
         """
         # Claude conversations are stored in project_path/.claude
         # e.g., ../4to1-planner-dev/.claude
-        abs_path = (Path(settings.base_dir) / project_path).resolve()
+        abs_path = _resolve_project_path(str(settings.base_dir), project_path)
         claude_dir = abs_path / ".claude"
 
         return claude_dir
@@ -62,12 +107,10 @@ class ClaudeCollector:
         Returns:
             Path to Claude sessions directory in ~/.claude/projects/
         """
-        abs_path = (Path(settings.base_dir) / project_path).resolve()
-        abs_path_str = str(abs_path)
+        abs_path_str = str(_resolve_project_path(str(settings.base_dir), project_path))
 
         # Convert Windows path to WSL format if needed
-        import re
-        if re.match(r'^[A-Za-z]:\\', abs_path_str):
+        if _WINDOWS_DRIVE_RE.match(abs_path_str):
             drive_letter = abs_path_str[0].lower()
             path_remainder = abs_path_str[3:].replace('\\', '/')
             abs_path_str = f'/mnt/{drive_letter}/{path_remainder}'
@@ -80,82 +123,89 @@ class ClaudeCollector:
 
         return target_path
 
-    def parse_jsonl_session(self, session_file: Path) -> List[dict]:
-        """Parse a JSONL session file.
+    def _extract_into(self, msg: dict, user_questions: List[str],
+                      technical_details: List[str], topics: set) -> None:
+        """Add one message's key information to the running accumulators.
 
         Args:
-            session_file: Path to .jsonl file
-
-        Returns:
-            List of message objects
+            msg: Message object
+            user_questions: User question snippets (first 5 are kept)
+            technical_details: Technical text snippets (first 5 are kept)
+            topics: Matched tech keywords
         """
-        messages = []
-
-        if not session_file.exists():
-            return messages
+        # Extract user messages
+        if msg.get('type') == 'user':
+            content = msg.get('message', {}).get('content', '')
+            if isinstance(content, str) and content:
+                if len(user_questions) < MAX_EXTRACTED_ITEMS:
+                    user_questions.append(content[:200])  # First 200 chars
+            elif isinstance(content, list):
+                for item in content:
+                    if isinstance(item, dict) and item.get('type') == 'text':
+                        if len(user_questions) < MAX_EXTRACTED_ITEMS:
+                            user_questions.append(item.get('text', '')[:200])
 
-        try:
-            with open(session_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    if line.strip():
-                        try:
-                            msg = json.loads(line)
-                            messages.append(msg)
-                        except json.JSONDecodeError:
-                            continue
-        except Exception as e:
-            print(f"⚠️  Error reading {session_file}: {e}")
+        # Extract assistant thinking blocks
+        if msg.get('type') == 'assistant':
+            content = msg.get('message', {}).get('content', [])
+            if isinstance(content, list):
+                for item in content:
+                    if isinstance(item, dict):
+                        if item.get('type') == 'thinking':
+                            thinking = item.get('thinking', '')
+                            if thinking:
+                                # Extract key technical terms (from config)
+                                topics.update(self._tech_matcher.findall(thinking))
+
+                        if item.get('type') == 'text':
+                            text = item.get('text', '')
+                            # Extract code blocks or technical explanations
+                            if '```' in text or 'function' in text or 'class' in text:
+                                if len(technical_details) < MAX_EXTRACTED_ITEMS:
+                                    technical_details.append(text[:300])
 
-        return messages
+    def _scan_session(self, session_file: str) -> Tuple[List[dict], Optional[dict]]:
+        """Parse a JSONL session file and extract its key information in one pass.
 
-    def extract_key_info(self, messages: List[dict]) -> dict:
-        """Extract key information from messages.
+        Only the last messages are kept in memory, so long sessions are never
+        held in full.
 
         Args:
-            messages: List of message objects
+            session_file: Path to .jsonl file (a scandir entry's path string)
 
         Returns:
-            Dictionary with extracted info
+            Tuple of (last 20 messages, extracted info), or ([], None) if the
+            file has no messages
         """
+        last_messages = deque(maxlen=CONTEXT_MESSAGES)
         user_questions = []
         technical_details = []
         topics = set()
+        message_count = 0
 
-        for msg in messages:
-            # Extract user messages
-            if msg.get('type') == 'user':
-                content = msg.get('message', {}).get('content', '')
-                if isinstance(content, str) and content:
-                    user_questions.append(content[:200])  # First 200 chars
-                elif isinstance(content, list):
-                    for item in content:
-                        if isinstance(item, dict) and item.get('type') == 'text':
-                            user_questions.append(item.get('text', '')[:200])
+        try:
+            # Binary lines go straight to the JSON parser (no text decoding
+            # pass); blank and malformed lines fail to parse and are skipped
+            with open(session_file, 'rb') as f:
+                for line in f:
+                    try:
+                        msg = _json_loads(line)
+                    except ValueError:
+                        continue
+                    message_count += 1
+                    last_messages.append(msg)
+                    self._extract_into(msg, user_questions, technical_details, topics)
+        except FileNotFoundError:
+            return [], None
+        except Exception as e:
+            print(f"⚠️  Error reading {session_file}: {e}")
 
-            # Extract assistant thinking blocks
-            if msg.get('type') == 'assistant':
-                content = msg.get('message', {}).get('content', [])
-                if isinstance(content, list):
-                    for item in content:
-                        if isinstance(item, dict):
-                            if item.get('type') == 'thinking':
-                                thinking = item.get('thinking', '')
-                                if thinking:
-                                    # Extract key technical terms (from config)
-                                    tech_keywords = bip_settings.tech_keywords
-                                    pattern = r'\b(' + '|'.join(re.escape(k) for k in tech_keywords) + r')\b'
-                                    tech_terms = re.findall(pattern, thinking, re.IGNORECASE)
-                                    topics.update(tech_terms)
-
-                            if item.get('type') == 'text':
-                                text = item.get('text', '')
-                                # Extract code blocks or technical explanations
-                                if '```' in text or 'function' in text or 'class' in text:
-                                    technical_details.append(text[:300])
+        if not message_count:
+            return [], None
 
-        return {
-            "user_questions": user_questions[:5],  # Top 5 questions
-            "technical_details": technical_details[:5],  # Top 5 technical items
+        return list(last_messages), {
+            "user_questions": user_questions,  # Top 5 questions
+            "technical_details": technical_details,  # Top 5 technical items
             "topics": list(topics)[:10],  # Top 10 topics
         }
 
@@ -182,38 +232,33 @@ class ClaudeCollector:
         else:
             central_dir = None
 
-        if central_dir and central_dir.exists() and os.path.isdir(str(central_dir)):
+        if central_dir and os.path.isdir(str(central_dir)):
             try:
-                # Use os.listdir to handle directories with leading dash
-                for filename in os.listdir(str(central_dir)):
-                    if not filename.endswith('.jsonl'):
-                        continue
-
-                    # Skip agent files
-                    if filename.startswith("agent-"):
-                        continue
-
-                    session_file_path = os.path.join(str(central_dir), filename)
-                    session_file = Path(session_file_path)
-
+                # Use os.scandir on the str path to handle directories with
+                # leading dash; entries carry their name and cached stat()
+                with os.scandir(str(central_dir)) as entries:
+                    session_entries = [
+                        entry for entry in entries
+                        # Skip non-session and agent files
+                        if entry.name.endswith('.jsonl') and not entry.name.startswith("agent-")
+                    ]
+
+                for entry in session_entries:
                     # Check modification time
-                    mtime = datetime.fromtimestamp(session_file.stat().st_mtime)
+                    mtime = datetime.fromtimestamp(entry.stat().st_mtime)
                     if mtime < since_date:
                         continue
 
-                    # Parse session
-                    messages = self.parse_jsonl_session(session_file)
+                    # Parse session and extract key info
+                    messages, key_info = self._scan_session(entry.path)
                     if not messages:
                         continue
 
-                    # Extract key info
-                    key_info = self.extract_key_info(messages)
-
                     conversations.append(
                         ClaudeConversation(
-                            session_id=session_file.stem,
+                            session_id=entry.name[:-len('.jsonl')],
                             project=project_name,
-                            messages=messages[-20:],  # Keep last 20 messages for context
+                            messages=messages,  # Last 20 messages for context
                             key_topics=key_info['topics'],
                             technical_details=key_info['technical_details'],
                             timestamp=mtime,
@@ -225,35 +270,38 @@ class ClaudeCollector:
         # Also try project's local .claude directory (may have exported JSONLs)
         local_claude_dir = self._get_project_claude_dir(project_path)
         if local_claude_dir.exists():
+            # Sessions already collected from the central directory
+            seen_ids = {c.session_id for c in conversations}
             try:
-                for session_file in local_claude_dir.glob("*.jsonl"):
-                    # Skip agent files
-                    if session_file.name.startswith("agent-"):
+                with os.scandir(local_claude_dir) as entries:
+                    session_entries = [
+                        entry for entry in entries
+                        # Skip non-session and agent files
+                        if entry.name.endswith('.jsonl') and not entry.name.startswith("agent-")
+                    ]
+
+                for entry in session_entries:
+                    # Avoid duplicates (before paying for the stat and parse)
+                    session_id = entry.name[:-len('.jsonl')]
+                    if session_id in seen_ids:
                         continue
 
                     # Check modification time
-                    mtime = datetime.fromtimestamp(session_file.stat().st_mtime)
+                    mtime = datetime.fromtimestamp(entry.stat().st_mtime)
                     if mtime < since_date:
                         continue
 
-                    # Parse session
-                    messages = self.parse_jsonl_session(session_file)
+                    # Parse session and extract key info
+                    messages, key_info = self._scan_session(entry.path)
                     if not messages:
                         continue
 
-                    # Extract key info
-                    key_info = self.extract_key_info(messages)
-
-                    # Avoid duplicates
-                    session_id = session_file.stem
-                    if any(c.session_id == session_id for c in conversations):
-                        continue
-
+                    seen_ids.add(session_id)
                     conversations.append(
                         ClaudeConversation(
                             session_id=session_id,
                             project=project_name,
-                            messages=messages[-20:],  # Keep last 20 messages for context
+                            messages=messages,  # Last 20 messages for context
                             key_topics=key_info['topics'],
                             technical_details=key_info['technical_details'],
                             timestamp=mtime,
@@ -271,13 +319,17 @@ class ClaudeCollector:
             List of all ClaudeConversation objects
         """
         all_conversations = []
-
-        for project in self.projects:
-            project_conversations = self.collect_conversations(
-                project['path'],
-                project['name']
-            )
-            all_conversations.extend(project_conversations)
+        if not self.projects:
+            return all_conversations
+
+        # Projects are independent and I/O-bound (directory scans and JSONL reads),
+        # so collect them concurrently; map() keeps the results in project order
+        with ThreadPoolExecutor(max_workers=min(32, len(self.projects))) as executor:
+            for project_conversations in executor.map(
+                lambda project: self.collect_conversations(project['path'], project['name']),
+                self.projects,
+            ):
+                all_conversations.extend(project_conversations)
 
         # Sort by timestamp descending
         all_conversations.sort(key=lambda x: x.timestamp, reverse=True)
@@ -2,6 +2,7 @@
 
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List
@@ -10,6 +11,9 @@ from git import Repo, InvalidGitRepositoryError
 from src.models import GitCommit
 from src.config import settings
 
+# Local date-time format for git's --since (same window as the lookback cutoff)
+GIT_SINCE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
 
 class GitCollector:
     """Collect Git commit information from monitored projects."""
@@ -41,39 +45,73 @@ class GitCollector:
 
         # Calculate since date
         since_date = datetime.now() - timedelta(days=self.lookback_days)
-        since_str = since_date.strftime("%Y-%m-%d")
+        since_str = since_date.strftime(GIT_SINCE_FORMAT)
 
         try:
-            # Use git log command directly
-            result = subprocess.run(
+            # Use git log command directly, parsing lines as git writes them
+            # instead of buffering the whole output
+            with subprocess.Popen(
                 ['git', 'log', f'--since={since_str}', '--no-merges',
                  '--pretty=format:%H|%an|%ct|%s'],
                 cwd=str(abs_path),
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 text=True,
                 encoding='utf-8'
-            )
-
-            if result.returncode == 0 and result.stdout:
-                for line in result.stdout.strip().split('\n'):
-                    if line:
-                        parts = line.split('|', 3)
-                        if len(parts) == 4:
-                            hash_full, author, timestamp, message = parts
-                            commits.append(
-                                GitCommit(
-                                    hash=hash_full[:7],
-                                    message=message.strip(),
-                                    author=author,
-                                    timestamp=datetime.fromtimestamp(int(timestamp)),
-                                    project=project_name,
-                                )
+            ) as proc:
+                for line in proc.stdout:
+                    parts = line.rstrip('\n').split('|', 3)
+                    if len(parts) == 4:
+                        hash_full, author, timestamp, message = parts
+                        commits.append(
+                            GitCommit(
+                                hash=hash_full[:7],
+                                message=message.strip(),
+                                author=author,
+                                timestamp=datetime.fromtimestamp(int(timestamp)),
+                                project=project_name,
                             )
+                        )
+
+            # A failed git log (e.g. not a repository) yields no commits
+            if proc.returncode != 0:
+                commits = []
         except Exception as e:
             print(f"⚠️  Could not read commits from {project_name}: {str(e)[:80]}")
 
         return commits
 
+    def _commits_since(self, repo_commits, since_date: datetime, project_name: str) -> List[GitCommit]:
+        """Convert GitPython commits inside the lookback window to GitCommits.
+
+        The date check also guards the since= query, which has been
+        unreliable on Windows.
+
+        Args:
+            repo_commits: Iterable of GitPython Commit objects
+            since_date: Start of the lookback window
+            project_name: Name of the project
+
+        Returns:
+            List of GitCommit objects
+        """
+        commits = []
+        for commit in repo_commits:
+            commit_date = datetime.fromtimestamp(commit.committed_date)
+
+            # Only include commits within lookback period
+            if commit_date >= since_date:
+                commits.append(
+                    GitCommit(
+                        hash=commit.hexsha[:7],
+                        message=commit.message.strip(),
+                        author=commit.author.name,
+                        timestamp=commit_date,
+                        project=project_name,
+                    )
+                )
+        return commits
+
     def collect_commits(self, project_path: str, project_name: str) -> List[GitCommit]:
         """Collect commits from a project.
 
@@ -104,24 +142,32 @@ class GitCollector:
 
         # Get commits
         try:
-            # Try to get all commits and filter by date manually
-            # This is more robust than using since parameter on Windows
-            all_commits = list(repo.iter_commits(max_count=100, no_merges=True))
-
-            for commit in all_commits:
-                commit_date = datetime.fromtimestamp(commit.committed_date)
-
-                # Only include commits within lookback period
-                if commit_date >= since_date:
-                    commits.append(
-                        GitCommit(
-                            hash=commit.hexsha[:7],
-                            message=commit.message.strip(),
-                            author=commit.author.name,
-                            timestamp=commit_date,
-                            project=project_name,
-                        )
-                    )
+            # Let git apply the lookback window (rev-list --since, on the
+            # committer date) so commits outside it are never materialized.
+            # If GitPython fails here, the subprocess fallback below runs the
+            # same git log query
+            commits = self._commits_since(
+                repo.iter_commits(
+                    since=since_date.strftime(GIT_SINCE_FORMAT),
+                    max_count=100,
+                    no_merges=True,
+                ),
+                since_date,
+                project_name,
+            )
+
+            # since= has been unreliable on Windows, and a misparse shows up as
+            # an empty result. If the newest commit is inside the window the
+            # result is wrong, so redo it the original way (latest commits,
+            # filtered by date here)
+            if not commits and self._commits_since(
+                repo.iter_commits(max_count=1, no_merges=True), since_date, project_name
+            ):
+                commits = self._commits_since(
+                    repo.iter_commits(max_count=100, no_merges=True),
+                    since_date,
+                    project_name,
+                )
         except (ValueError, Exception) as e:
             # GitPython failed, try subprocess fallback
             print(f"   ⚡ Using git command fallback for {project_name}...")
@@ -139,13 +185,17 @@ class GitCollector:
             List of all GitCommit objects
         """
         all_commits = []
-
-        for project in self.projects:
-            project_commits = self.collect_commits(
-                project['path'],
-                project['name']
-            )
-            all_commits.extend(project_commits)
+        if not self.projects:
+            return all_commits
+
+        # Projects are independent and I/O-bound (git subprocess / repo reads),
+        # so collect them concurrently; map() keeps the results in project order
+        with ThreadPoolExecutor(max_workers=min(32, len(self.projects))) as executor:
+            for project_commits in executor.map(
+                lambda project: self.collect_commits(project['path'], project['name']),
+                self.projects,
+            ):
+                all_commits.extend(project_commits)
 
         # Sort by timestamp descending
         all_commits.sort(key=lambda x: x.timestamp, reverse=True)
@@ -0,0 +1,90 @@
+"""Case-insensitive whole-word keyword matching for topic detection."""
+
+import re
+from typing import Iterable, List
+
+# pyahocorasick is optional - used for single-pass keyword scanning when installed
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+def _is_word_char(char: str) -> bool:
+    """Check whether a character is a word character in the regex sense."""
+    return char.isalnum() or char == '_'
+
+
+class TechKeywordMatcher:
+    """Find keywords in text like ``re.findall(r'\\b(k1|k2|...)\\b', text, re.I)``.
+
+    With pyahocorasick installed, all keywords are found in one pass over the
+    text and then filtered to exactly the matches the regex would return:
+    word boundaries on both sides, leftmost first, the earliest listed
+    keyword at each position, and no overlaps. Without it, the regex is used.
+    """
+
+    def __init__(self, keywords: Iterable[str], use_automaton: bool = True):
+        """Build the matchers.
+
+        Args:
+            keywords: Keywords to match, in priority order
+            use_automaton: Use pyahocorasick when available (False forces the regex)
+        """
+        keywords = tuple(keywords)
+        self.pattern = re.compile(
+            r'\b(' + '|'.join(re.escape(k) for k in keywords) + r')\b',
+            re.IGNORECASE,
+        )
+
+        # An empty keyword matches everywhere; leave that to the regex
+        self.automaton = None
+        if use_automaton and ahocorasick is not None and keywords and all(keywords):
+            self.automaton = ahocorasick.Automaton()
+            for index, keyword in enumerate(keywords):
+                lowered_keyword = keyword.lower()
+                # Keywords equal up to case: the first one listed wins, as in the regex
+                if not self.automaton.exists(lowered_keyword):
+                    self.automaton.add_word(lowered_keyword, (index, len(lowered_keyword)))
+            self.automaton.make_automaton()
+
+    def findall(self, text: str) -> List[str]:
+        """Find keyword matches in text.
+
+        Args:
+            text: Text to scan, e.g. a thinking block
+
+        Returns:
+            Matched terms as they appear in the text, in order
+        """
+        lowered = text.lower()
+        # Lowercasing can change the length of some characters, which would
+        # break the match offsets; the regex handles those texts
+        if self.automaton is None or len(lowered) != len(text):
+            return self.pattern.findall(text)
+
+        # Best candidate per start offset: the earliest listed keyword that
+        # sits on word boundaries (what the regex alternation tries first)
+        best_at_start = {}
+        text_len = len(text)
+        for end, (index, length) in self.automaton.iter(lowered):
+            start = end - length + 1
+            before = start > 0 and _is_word_char(text[start - 1])
+            after = end + 1 < text_len and _is_word_char(text[end + 1])
+            if (before == _is_word_char(text[start])
+                    or after == _is_word_char(text[end])):
+                continue
+            current = best_at_start.get(start)
+            if current is None or index < current[0]:
+                best_at_start[start] = (index, end)
+
+        # Leftmost first, skipping candidates that overlap an earlier match
+        terms = []
+        next_start = 0
+        for start in sorted(best_at_start):
+            if start < next_start:
+                continue
+            end = best_at_start[start][1]
+            terms.append(text[start:end + 1])
+            next_start = end + 1
+        return terms
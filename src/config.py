@@ -176,6 +176,12 @@ class Settings(BaseSettings):
     calendar_lunch_end: int = 14
     calendar_gap_minutes: int = 20
 
+    # -------------------------------------------------------------------------
+    # Display
+    # -------------------------------------------------------------------------
+    # Emoji language flags in CLI tables (None = only on UTF-8 terminals)
+    unicode_flags: Optional[bool] = None
+
     # -------------------------------------------------------------------------
     # Database & Logging
     # -------------------------------------------------------------------------
@@ -12,6 +12,7 @@ Features:
 """
 
 import re
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
@@ -19,6 +20,18 @@ from datetime import datetime
 from src.config import settings, bip_settings
 
 
+@dataclass
+class PendingImagePosts:
+    """Posts that still need images, as found by find_unprocessed_posts()."""
+    temp_folders: List[Path] = field(default_factory=list)
+    selected_files: List[Path] = field(default_factory=list)
+    # Posts passed over because they are already done (images.ready / images.skipped)
+    already_done: int = 0
+
+    def __bool__(self) -> bool:
+        return bool(self.temp_folders or self.selected_files)
+
+
 # Supported image extensions
 SUPPORTED_IMAGE_EXTENSIONS = ['.png', '.jpg', '.jpeg', '.webp']
 
@@ -51,8 +64,10 @@ class ImageGenerator:
         self.selected_posts_dir = self.base_dir / "data" / "selected_posts"
         self.post_images_dir = self.base_dir / "data" / "post-images"
 
-        # Image generation marker
+        # Image generation markers. images.skipped records a post that has no
+        # image prompts, so later scans don't keep picking it up
         self.images_ready_marker = "images.ready"
+        self.images_skipped_marker = "images.skipped"
 
         # Image generation clients (fallback chain: Vertex AI -> Gemini API -> OpenAI)
         self.gemini_client = None
@@ -692,6 +707,7 @@ Style: Professional, clean, modern digital illustration suitable for social medi
 
             if not post_file:
                 results["message"] = "No post.md or image-prompt.md found in folder"
+                results["no_prompts"] = True
                 return results
 
             # Read post content
@@ -709,6 +725,7 @@ Style: Professional, clean, modern digital illustration suitable for social medi
 
         if not prompts:
             results["message"] = "No image prompts extracted"
+            results["no_prompts"] = True
             return results
 
         # Get dimensions for platform
@@ -762,10 +779,55 @@ Style: Professional, clean, modern digital illustration suitable for social medi
 
         return results
 
+    def _temp_post_is_generated(self, folder: Path) -> bool:
+        """Check whether a temp post folder holds a generated post (has post.ready)."""
+        return folder.is_dir() and (folder / "post.ready").exists()
+
+    def _is_done(self, images_dir: Path) -> bool:
+        """Check whether a post's images are generated or were skipped for good."""
+        return ((images_dir / self.images_ready_marker).exists()
+                or (images_dir / self.images_skipped_marker).exists())
+
+    def find_unprocessed_posts(self, force: bool = False) -> PendingImagePosts:
+        """Find the posts that process_unprocessed_posts() will generate images for.
+
+        Scans temp_posts (folders with post.ready) and selected_posts
+        (post_*.md files), leaving out posts that already have images.ready or
+        images.skipped. The result can be passed back to
+        process_unprocessed_posts() so the directories aren't scanned twice.
+
+        Args:
+            force: Include posts that are already done
+
+        Returns:
+            PendingImagePosts (falsy if there is nothing to generate)
+        """
+        pending = PendingImagePosts()
+
+        if self.temp_posts_dir.exists():
+            for folder in self.temp_posts_dir.iterdir():
+                # Only folders that have post.ready (meaning post is generated)
+                if not self._temp_post_is_generated(folder):
+                    continue
+                if not force and self._is_done(folder):
+                    pending.already_done += 1
+                    continue
+                pending.temp_folders.append(folder)
+
+        if self.selected_posts_dir.exists():
+            for post_file in self.selected_posts_dir.glob("post_*.md"):
+                if not force and self._is_done(self.post_images_dir / post_file.stem):
+                    pending.already_done += 1
+                    continue
+                pending.selected_files.append(post_file)
+
+        return pending
+
     def process_unprocessed_posts(
         self,
         platform: str = "xiaohongshu",
-        force: bool = False
+        force: bool = False,
+        pending: Optional[PendingImagePosts] = None
     ) -> Tuple[int, int, int]:
         """
         Process all posts that don't have images yet.
@@ -775,121 +837,107 @@ Style: Professional, clean, modern digital illustration suitable for social medi
         Args:
             platform: Target platform
             force: Force regeneration
+            pending: Result of find_unprocessed_posts() to process instead of
+                scanning again
 
         Returns:
             Tuple of (processed, failed, skipped)
         """
         processed = 0
         failed = 0
-        skipped = 0
 
-        # Scan temp_posts
-        if self.temp_posts_dir.exists():
-            for folder in self.temp_posts_dir.iterdir():
-                if not folder.is_dir():
-                    continue
+        if pending is None:
+            pending = self.find_unprocessed_posts(force=force)
+        skipped = pending.already_done
 
-                # Only process folders that have post.ready (meaning post is generated)
-                post_ready = folder / "post.ready"
-                if not post_ready.exists():
-                    continue
-
-                # Check if images already generated
-                images_ready = folder / self.images_ready_marker
-                if images_ready.exists() and not force:
-                    skipped += 1
-                    continue
+        # Temp posts
+        for folder in pending.temp_folders:
+            print(f"\n  📁 Processing: {folder.name}")
+            results = self.generate_images_for_post(folder, platform, force)
 
-                print(f"\n  📁 Processing: {folder.name}")
-                results = self.generate_images_for_post(folder, platform, force)
+            if results.get("success", 0) > 0:
+                processed += 1
+            elif results.get("failed", 0) > 0:
+                failed += 1
+            else:
+                if results.get("no_prompts"):
+                    (folder / self.images_skipped_marker).touch()
+                skipped += 1
 
-                if results.get("success", 0) > 0:
-                    processed += 1
-                elif results.get("failed", 0) > 0:
-                    failed += 1
-                else:
-                    skipped += 1
+        # Selected posts
+        for post_file in pending.selected_files:
+            # Create a pseudo-folder for selected posts
+            post_name = post_file.stem
+            images_folder = self.post_images_dir / post_name
+            images_marker = images_folder / self.images_ready_marker
 
-        # Scan selected_posts
-        if self.selected_posts_dir.exists():
-            for post_file in self.selected_posts_dir.glob("post_*.md"):
-                # Skip image-prompt files
-                if post_file.name.startswith("image-prompt_"):
-                    continue
+            print(f"\n  📄 Processing selected post: {post_name}")
 
-                # Create a pseudo-folder for selected posts
-                post_name = post_file.stem
-                images_folder = self.post_images_dir / post_name
-                images_marker = images_folder / self.images_ready_marker
+            prompts = []
 
-                if images_marker.exists() and not force:
-                    skipped += 1
+            # Priority 1: Look for companion image-prompt file
+            image_prompt_file = self.selected_posts_dir / f"image-prompt_{post_name}.md"
+            if image_prompt_file.exists():
+                try:
+                    with open(image_prompt_file, 'r', encoding='utf-8') as f:
+                        prompt_content = f.read()
+                    prompts = self.extract_image_prompts_from_post(prompt_content, post_name)
+                    if prompts:
+                        print(f"    📄 Using prompts from: image-prompt_{post_name}.md")
+                except Exception as e:
+                    print(f"    ⚠️  Failed to read image-prompt file: {e}")
+
+            # Priority 2: Fall back to extracting from post file
+            if not prompts:
+                try:
+                    with open(post_file, 'r', encoding='utf-8') as f:
+                        content = f.read()
+                    prompts = self.extract_image_prompts_from_post(content, post_name)
+                    if prompts:
+                        print(f"    📄 Using prompts from: {post_file.name}")
+                except Exception as e:
+                    print(f"    ❌ Failed to read: {e}")
+                    failed += 1
                     continue
 
-                print(f"\n  📄 Processing selected post: {post_name}")
-
-                prompts = []
-
-                # Priority 1: Look for companion image-prompt file
-                image_prompt_file = self.selected_posts_dir / f"image-prompt_{post_name}.md"
-                if image_prompt_file.exists():
-                    try:
-                        with open(image_prompt_file, 'r', encoding='utf-8') as f:
-                            prompt_content = f.read()
-                        prompts = self.extract_image_prompts_from_post(prompt_content, post_name)
-                        if prompts:
-                            print(f"    📄 Using prompts from: image-prompt_{post_name}.md")
-                    except Exception as e:
-                        print(f"    ⚠️  Failed to read image-prompt file: {e}")
-
-                # Priority 2: Fall back to extracting from post file
-                if not prompts:
-                    try:
-                        with open(post_file, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                        prompts = self.extract_image_prompts_from_post(content, post_name)
-                        if prompts:
-                            print(f"    📄 Using prompts from: {post_file.name}")
-                    except Exception as e:
-                        print(f"    ❌ Failed to read: {e}")
-                        failed += 1
-                        continue
-
-                if not prompts:
-                    print(f"    ⚠️  No prompts extracted")
-                    skipped += 1
-                    continue
+            if not prompts:
+                print(f"    ⚠️  No prompts extracted")
+                images_folder.mkdir(parents=True, exist_ok=True)
+                (images_folder / self.images_skipped_marker).touch()
+                skipped += 1
+                continue
 
-                # Generate
-                width, height = get_platform_dimensions(platform)
-                success_count = 0
-
-                for prompt_info in prompts:
-                    image_name = prompt_info["name"].lower().replace(" ", "_")
-                    image_name = re.sub(r'[^a-z0-9_]', '', image_name)
-
-                    print(f"    🎨 Generating: {prompt_info['name']}...")
-                    result = self.generate_image(
-                        prompt=prompt_info["prompt"],
-                        output_path=images_folder,
-                        image_name=image_name,
-                        width=width,
-                        height=height,
-                        platform=platform
-                    )
-
-                    if result.get("success"):
-                        success_count += 1
-                        print(f"    ✅ Saved: {result['file_path']}")
-                    else:
-                        print(f"    ❌ Failed: {result.get('error', 'Unknown error')}")
+            # Generate
+            width, height = get_platform_dimensions(platform)
+            success_count = 0
+
+            for prompt_info in prompts:
+                image_name = prompt_info["name"].lower().replace(" ", "_")
+                image_name = re.sub(r'[^a-z0-9_]', '', image_name)
+
+                print(f"    🎨 Generating: {prompt_info['name']}...")
+                result = self.generate_image(
+                    prompt=prompt_info["prompt"],
+                    output_path=images_folder,
+                    image_name=image_name,
+                    width=width,
+                    height=height,
+                    platform=platform
+                )
 
-                if success_count > 0:
-                    images_marker.parent.mkdir(parents=True, exist_ok=True)
-                    images_marker.touch()
-                    processed += 1
+                if result.get("success"):
+                    success_count += 1
+                    print(f"    ✅ Saved: {result['file_path']}")
                 else:
-                    failed += 1
+                    print(f"    ❌ Failed: {result.get('error', 'Unknown error')}")
+
+            # generate_image() creates the folder when it saves an image,
+            # so it already exists here
+            if success_count > 0:
+                images_marker.touch()
+                processed += 1
+            else:
+                failed += 1
 
         return processed, failed, skipped
 
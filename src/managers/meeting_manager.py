@@ -9,6 +9,7 @@ weekly goals.
 import os
 import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
@@ -388,11 +389,18 @@ class MeetingManager:
         # Load projects from config
         project_configs = self._load_projects()
 
-        projects = []
-        for name, config in project_configs.items():
+        for name in project_configs:
             print(f"  📁 {name}...")
-            status = self.collect_project_status(name, config)
-            projects.append(status)
+
+        # Each project's git log is an independent subprocess, so collect them concurrently
+        projects = []
+        if project_configs:
+            with ThreadPoolExecutor(max_workers=min(8, len(project_configs))) as executor:
+                projects = list(executor.map(
+                    self.collect_project_status,
+                    project_configs.keys(),
+                    project_configs.values()
+                ))
 
         return MeetingReport(
             date=datetime.now(),
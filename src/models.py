@@ -1,6 +1,7 @@
 """Data models for the Build-in-Public system."""
 
 # Fix for pyenv Python 3.12 without built-in sqlite3 support
+import functools
 import sys
 try:
     import sqlite3
@@ -13,12 +14,19 @@ from datetime import datetime
 from enum import Enum
 from typing import List, Optional, Dict
 from pydantic import BaseModel, Field
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, JSON, create_engine
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, JSON, Index, create_engine, func, literal_column
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import sessionmaker
 
 from src.config import settings
 
+# orjson is optional - used for faster JSON column serialization when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 Base = declarative_base()
 
@@ -92,6 +100,10 @@ class GeneratedPost(BaseModel):
 class PostRecord(Base):
     """Database model for post records."""
     __tablename__ = 'posts'
+    __table_args__ = (
+        # Draft listing in `select`: filter by status, newest first
+        Index('ix_posts_status_created', 'status', 'created_at'),
+    )
 
     id = Column(Integer, primary_key=True)
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -135,6 +147,49 @@ class PostRecord(Base):
     comments = Column(Integer, default=0)
     shares = Column(Integer, default=0)
 
+    @hybrid_property
+    def title(self) -> str:
+        """First line of the content, truncated to 50 characters."""
+        return self.content.partition('\n')[0][:50] if self.content else ""
+
+    @title.expression
+    def title(cls):
+        first_line = func.substr(cls.content, 1, func.instr(cls.content.concat('\n'), '\n') - 1)
+        return func.substr(first_line, 1, 50)
+
+    @classmethod
+    def from_generated(cls, post: GeneratedPost, source_data: Optional[dict], generation_date: datetime) -> "PostRecord":
+        """Build a draft record from a generated post.
+
+        Args:
+            post: Generated post from PostGenerator
+            source_data: JSON-ready collected data, shared across a batch
+            generation_date: Timestamp for the generation batch
+
+        Returns:
+            Unsaved PostRecord in DRAFT status
+        """
+        return cls(
+            generation_date=generation_date,
+            content=post.content,
+            style=post.style.value,
+            language=post.language.value,
+            hashtags=post.hashtags,
+            word_count=post.word_count,
+            projects_mentioned=post.projects_mentioned,
+            technical_keywords=post.technical_keywords,
+            source_data=source_data,
+            generation_metadata=post.metadata,
+            status=PostStatus.DRAFT.value,
+        )
+
+
+# Temp post folder name stored in generation_metadata. The JSON path is a
+# literal (not a bound parameter) so SQLite can match queries against the
+# expression index below.
+post_folder_name = func.json_extract(PostRecord.generation_metadata, literal_column("'$.folder_name'"))
+Index('ix_posts_folder_name', post_folder_name)
+
 
 class GenerationLog(Base):
     """Log of generation attempts."""
@@ -150,15 +205,45 @@ class GenerationLog(Base):
 
 
 # Database setup
+def _orjson_serializer(obj) -> str:
+    """Serialize a JSON column value with orjson (returns str, as SQLAlchemy expects)."""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+
+@functools.lru_cache(maxsize=1)
+def _get_engine():
+    """Get the process-wide database engine, using orjson for JSON columns if available.
+
+    Creating an engine builds a new connection pool, so it is done once and
+    shared by every session instead of once per get_session() call.
+    """
+    if orjson is not None:
+        return create_engine(
+            settings.database_url,
+            json_serializer=_orjson_serializer,
+            json_deserializer=orjson.loads,
+        )
+    return create_engine(settings.database_url)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_session_factory():
+    """Get the session factory bound to the shared engine."""
+    return sessionmaker(bind=_get_engine())
+
+
 def init_db():
     """Initialize database."""
-    engine = create_engine(settings.database_url)
+    engine = _get_engine()
     Base.metadata.create_all(engine)
+    # create_all skips tables that already exist, so add any indexes
+    # declared after an existing database was created
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
     return engine
 
 
 def get_session():
     """Get database session."""
-    engine = create_engine(settings.database_url)
-    Session = sessionmaker(bind=engine)
-    return Session()
+    return _get_session_factory()()
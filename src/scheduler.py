@@ -57,22 +57,12 @@ class DailyScheduler:
                 count=settings.posts_per_day
             )
 
-            # Save posts
-            for post in posts:
-                record = PostRecord(
-                    generation_date=datetime.now(),
-                    content=post.content,
-                    style=post.style.value,
-                    language=post.language.value,
-                    hashtags=post.hashtags,
-                    word_count=post.word_count,
-                    projects_mentioned=post.projects_mentioned,
-                    technical_keywords=post.technical_keywords,
-                    source_data=data.model_dump(mode='json'),
-                    generation_metadata=post.metadata,
-                    status=PostStatus.DRAFT.value,
-                )
-                session.add(record)
+            # Save posts (serialize the collected data once for the batch)
+            now = datetime.now()
+            source_data = data.model_dump(mode='json')
+            session.add_all(
+                [PostRecord.from_generated(post, source_data, now) for post in posts]
+            )
 
             # Update log
             log.posts_generated = len(posts)
@@ -116,7 +106,7 @@ class DailyScheduler:
             publisher = XiaohongshuPublisher()
             result = publisher.publish(
                 content=selected_post.content,
-                title=selected_post.content.split('\n')[0][:50],
+                title=selected_post.title,
             )
 
             # Update post
@@ -385,7 +385,7 @@ class PostScheduler:
             publisher = XiaohongshuPublisher()
 
             # Extract title from first line
-            title = post.content.split('\n')[0][:50] if post.content else "Post"
+            title = post.title or "Post"
 
             result = publisher.publish(
                 content=post.content,
@@ -451,13 +451,18 @@ class PostScheduler:
             print(f"  ⚠️  Failed to create publish marker: {e}")
             return False
 
-    def process_due_posts(self) -> Tuple[int, int]:
+    def process_due_posts(self, due_posts: Optional[List[PostRecord]] = None) -> Tuple[int, int]:
         """Process all posts that are due for publishing.
 
+        Args:
+            due_posts: Result of a get_due_posts() call just made by the
+                caller, to avoid querying again (default: query now)
+
         Returns:
             Tuple of (published_count, failed_count)
         """
-        due_posts = self.get_due_posts()
+        if due_posts is None:
+            due_posts = self.get_due_posts()
 
         if not due_posts:
             return 0, 0
@@ -0,0 +1,50 @@
+"""Tests for the tech keyword matcher."""
+
+import random
+
+import pytest
+
+from src.collectors.keyword_matcher import TechKeywordMatcher
+
+# The comparison needs the optional automaton backend
+pytest.importorskip("ahocorasick")
+
+# Config defaults plus keywords that overlap each other or end in non-word characters
+KEYWORDS = [
+    "API", "SaaS", "FIRE", "Docker", "FastAPI", "PostgreSQL", "Redis",
+    "Kubernetes", "MongoDB", "React", "Vue", "Python", "TypeScript",
+    "JavaScript", "Go", "Rust", "Java", "Node.js", "GraphQL", "REST",
+    "AWS", "GCP", "Azure", "CI/CD", "DevOps", "Microservices",
+    "React Native", "Native", "Golang", "C++", ".NET", "SQL", "api",
+]
+
+TEXTS = [
+    "",
+    "Using React Native with a REST API on AWS",
+    "react native vs native react; fastapi/FastAPI, restful REST",
+    "Go golang GoLang gopher Go! go_lang",
+    "C++ and C++x and .NET vs a.NET and (.NET)",
+    "PostgreSQL is SQL; MySQL is not; sql_alchemy",
+    "CI/CD pipelines, ci/cd, CI/CDs",
+    "Java JavaScript TypeScript Java-based java_script",
+    "İstanbul API",  # lowercasing changes the length, regex fallback
+]
+
+
+def _assert_same(text):
+    regex_matcher = TechKeywordMatcher(KEYWORDS, use_automaton=False)
+    automaton_matcher = TechKeywordMatcher(KEYWORDS)
+    assert automaton_matcher.automaton is not None
+    assert automaton_matcher.findall(text) == regex_matcher.findall(text)
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_automaton_matches_regex(text):
+    _assert_same(text)
+
+
+def test_automaton_matches_regex_random_text():
+    rng = random.Random(0)
+    tokens = KEYWORDS + [k.lower() for k in KEYWORDS] + [" ", ".", "_", "x", "+", "/", "-", "(", ")", "9"]
+    for _ in range(2000):
+        _assert_same("".join(rng.choice(tokens) for _ in range(rng.randint(1, 12))))